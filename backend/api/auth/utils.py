@@ -40,9 +40,22 @@ def get_supabase_user_id(request: Request) -> Optional[str]:
     return None
 
 
-
-
-
-
-
-
+def get_cached_supabase_user_id(request: Request) -> str:
+    """
+    Get the Supabase user ID for a request, resolved once per request.
+    
+    Permissions and throttles may each ask several times per request, so the
+    lookup is memoized on the request; an empty string records "no user" so
+    that case is cached too.
+    
+    Args:
+        request: DRF request object
+        
+    Returns:
+        Supabase user ID (UUID string) or '' when unauthenticated
+    """
+    supabase_user_id = getattr(request, '_cached_supabase_user_id', None)
+    if supabase_user_id is None:
+        supabase_user_id = get_supabase_user_id(request) or ''
+        request._cached_supabase_user_id = supabase_user_id
+    return supabase_user_id
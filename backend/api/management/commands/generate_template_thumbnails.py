@@ -1,7 +1,7 @@
 """
 Django management command to generate thumbnail images from PDF template previews.
 
-This command converts the first page of each template PDF to a PNG thumbnail image.
+This command converts the first page of each template PDF to a WebP thumbnail image.
 """
 import os
 from pathlib import Path
@@ -23,11 +23,130 @@ except ImportError:
         PYMUPDF_VERSION = None
 
 try:
-    from PIL import Image as PILImage
+    from PIL import Image as PILImage, ImageOps
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
 
+THUMBNAILS_AVAILABLE = PYMUPDF_AVAILABLE and PILLOW_AVAILABLE
+
+# Default thumbnail size (380×500px) and render resolution
+THUMBNAIL_WIDTH = 380
+THUMBNAIL_HEIGHT = 500
+THUMBNAIL_DPI = 150
+
+# Thumbnails are WebP: noticeably smaller than PNG at the same visual quality
+THUMBNAIL_FILENAME = '{}-thumb.webp'
+# Double-resolution variant for HiDPI screens, cut from the same page render
+THUMBNAIL_2X_FILENAME = '{}-thumb@2x.webp'
+THUMBNAIL_WEBP_QUALITY = 80
+
+
+def _fit_to_canvas(source, target_width: int, target_height: int):
+    """
+    Scale an image down to fit the target size, centred on a white canvas.
+    
+    Args:
+        source: Rendered page image (left unmodified)
+        target_width: Width in pixels
+        target_height: Height in pixels
+        
+    Returns:
+        PIL.Image.Image: Image of exactly target_width × target_height
+    """
+    # Resize to fit the thumbnail size (maintains aspect ratio)
+    img = source
+    if img.width > target_width or img.height > target_height:
+        img = ImageOps.contain(source, (target_width, target_height), PILImage.Resampling.LANCZOS)
+    
+    # If image is smaller than target, create a canvas and center it
+    if img.width < target_width or img.height < target_height:
+        canvas = PILImage.new("RGB", (target_width, target_height), (255, 255, 255))
+        x_offset = (target_width - img.width) // 2
+        y_offset = (target_height - img.height) // 2
+        canvas.paste(img, (x_offset, y_offset))
+        img = canvas
+    return img
+
+
+def render_thumbnail(
+    pdf_document,
+    thumbnail_path,
+    width: int = THUMBNAIL_WIDTH,
+    dpi: int = THUMBNAIL_DPI,
+    thumbnail_2x_path=None
+):
+    """
+    Render the first page of an open PDF document to a WebP thumbnail.
+    
+    The page is rasterized once; every size is downscaled from that render.
+    
+    Args:
+        pdf_document: Open PyMuPDF document with at least one page
+        thumbnail_path: Where to save the WebP image
+        width: Thumbnail width in pixels
+        dpi: DPI for rendering the PDF page
+        thumbnail_2x_path: Optional path for a double-resolution variant
+        
+    Returns:
+        PIL.Image.Image: The saved thumbnail
+    """
+    # Get first page
+    first_page = pdf_document[0]
+    
+    # Calculate zoom factor for desired DPI
+    # Default PDF is 72 DPI, so zoom = desired_dpi / 72
+    zoom = dpi / 72.0
+    mat = fitz.Matrix(zoom, zoom)
+    
+    # Render page to pixmap (no alpha channel, so samples are packed RGB)
+    pix = first_page.get_pixmap(matrix=mat, alpha=False)
+    
+    # Wrap the pixmap's buffer in a PIL Image without copying it to bytes first
+    page_img = PILImage.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+    
+    # Target dimensions: 380×500px
+    target_width = width  # 380px
+    target_height = THUMBNAIL_HEIGHT
+    
+    if thumbnail_2x_path:
+        img_2x = _fit_to_canvas(page_img, target_width * 2, target_height * 2)
+        img_2x.save(thumbnail_2x_path, 'WEBP', quality=THUMBNAIL_WEBP_QUALITY, method=4)
+    
+    # Save thumbnail
+    img = _fit_to_canvas(page_img, target_width, target_height)
+    img.save(thumbnail_path, 'WEBP', quality=THUMBNAIL_WEBP_QUALITY, method=4)
+    return img
+
+
+def render_thumbnail_from_bytes(
+    pdf_bytes: bytes,
+    thumbnail_path,
+    width: int = THUMBNAIL_WIDTH,
+    dpi: int = THUMBNAIL_DPI,
+    thumbnail_2x_path=None
+):
+    """
+    Render a WebP thumbnail straight from in-memory PDF bytes.
+    
+    Args:
+        pdf_bytes: PDF document
+        thumbnail_path: Where to save the WebP image
+        width: Thumbnail width in pixels
+        dpi: DPI for rendering the PDF page
+        thumbnail_2x_path: Optional path for a double-resolution variant
+        
+    Returns:
+        PIL.Image.Image: The saved thumbnail
+    """
+    pdf_document = fitz.open(stream=pdf_bytes, filetype='pdf')
+    try:
+        if len(pdf_document) == 0:
+            raise ValueError('PDF has no pages')
+        return render_thumbnail(pdf_document, thumbnail_path, width, dpi, thumbnail_2x_path)
+    finally:
+        pdf_document.close()
+
 
 class Command(BaseCommand):
     help = 'Generate thumbnail images from PDF template previews'
@@ -48,15 +167,22 @@ class Command(BaseCommand):
         parser.add_argument(
             '--width',
             type=int,
-            default=380,
+            default=THUMBNAIL_WIDTH,
             help='Thumbnail width in pixels (default: 380)',
         )
         parser.add_argument(
             '--dpi',
             type=int,
-            default=150,
+            default=THUMBNAIL_DPI,
             help='DPI for rendering PDF page (default: 150)',
         )
+        parser.add_argument(
+            '--only',
+            action='append',
+            default=[],
+            metavar='TEMPLATE_ID',
+            help='Only generate the thumbnail for this template (can be repeated)',
+        )
 
     def handle(self, *args, **options):
         if not PYMUPDF_AVAILABLE:
@@ -112,6 +238,8 @@ class Command(BaseCommand):
             'ats-classic',
             'elegant-emerald',
         ]
+        if options['only']:
+            template_ids = [template_id for template_id in template_ids if template_id in options['only']]
         
         success_count = 0
         error_count = 0
@@ -129,8 +257,9 @@ class Command(BaseCommand):
                 continue
             
             # Output thumbnail filename
-            thumbnail_filename = f'{template_id}-thumb.png'
+            thumbnail_filename = THUMBNAIL_FILENAME.format(template_id)
             thumbnail_path = output_dir / thumbnail_filename
+            thumbnail_2x_path = output_dir / THUMBNAIL_2X_FILENAME.format(template_id)
             
             try:
                 # Open PDF
@@ -144,37 +273,7 @@ class Command(BaseCommand):
                     error_count += 1
                     continue
                 
-                # Get first page
-                first_page = pdf_document[0]
-                
-                # Calculate zoom factor for desired DPI
-                # Default PDF is 72 DPI, so zoom = desired_dpi / 72
-                zoom = dpi / 72.0
-                mat = fitz.Matrix(zoom, zoom)
-                
-                # Render page to pixmap
-                pix = first_page.get_pixmap(matrix=mat)
-                
-                # Convert to PIL Image
-                img = PILImage.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                
-                # Target dimensions: 380×500px
-                target_width = width  # 380px
-                target_height = 500
-                
-                # Resize to exact thumbnail size (maintains aspect ratio, may crop)
-                img.thumbnail((target_width, target_height), PILImage.Resampling.LANCZOS)
-                
-                # If image is smaller than target, create a canvas and center it
-                if img.width < target_width or img.height < target_height:
-                    canvas = PILImage.new("RGB", (target_width, target_height), (255, 255, 255))
-                    x_offset = (target_width - img.width) // 2
-                    y_offset = (target_height - img.height) // 2
-                    canvas.paste(img, (x_offset, y_offset))
-                    img = canvas
-                
-                # Save thumbnail
-                img.save(thumbnail_path, 'PNG', optimize=True)
+                img = render_thumbnail(pdf_document, thumbnail_path, width, dpi, thumbnail_2x_path)
                 
                 pdf_document.close()
                 
@@ -0,0 +1,29 @@
+"""
+Request middleware for the API.
+"""
+
+
+def _first_forwarded_ip(meta) -> str:
+    """
+    Get the client IP: the first X-Forwarded-For hop, or REMOTE_ADDR.
+    
+    Args:
+        meta: request.META
+        
+    Returns:
+        str: IP address ('' if neither header is set)
+    """
+    # partition() only splits off the first hop, without building a list of all of them
+    ip, _, _ = meta.get('HTTP_X_FORWARDED_FOR', '').partition(',')
+    return ip.strip() or meta.get('REMOTE_ADDR', '')
+
+
+class ClientIPMiddleware:
+    """Resolve the client IP once per request and expose it as request.client_ip."""
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        request.client_ip = _first_forwarded_ip(request.META)
+        return self.get_response(request)
@@ -1,22 +1,30 @@
 """
 Custom permissions for API endpoints.
 """
+from functools import partial
 from rest_framework.permissions import BasePermission
-from api.auth.utils import get_supabase_user_id
+from api.auth.utils import get_cached_supabase_user_id
+
+# Fields that may hold the owner's user ID, in order of precedence
+_OWNER_FIELDS = ('user_id', 'owner_id', 'created_by')
+
+# Sentinel for "field not present" (None is a valid stored value)
+_MISSING = object()
 
 
 class IsAuthenticated(BasePermission):
     """Allow only authenticated users."""
     
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated
+        user = request.user
+        return user is not None and user.is_authenticated
 
 
 class IsResumeOwner(BasePermission):
     """Only allow owners to access their resumes."""
     
     def has_object_permission(self, request, view, obj):
-        supabase_user_id = get_supabase_user_id(request)
+        supabase_user_id = get_cached_supabase_user_id(request)
         if not supabase_user_id:
             return False
         
@@ -35,19 +43,16 @@ class IsOwner(BasePermission):
     """Generic permission to check if user owns the resource."""
     
     def has_object_permission(self, request, view, obj):
-        supabase_user_id = get_supabase_user_id(request)
+        supabase_user_id = get_cached_supabase_user_id(request)
         if not supabase_user_id:
             return False
         
-        # Check various user_id field names
-        user_id_fields = ['user_id', 'owner_id', 'created_by']
-        
-        for field in user_id_fields:
-            if hasattr(obj, field):
-                return str(getattr(obj, field)) == supabase_user_id
-            
-            if isinstance(obj, dict) and field in obj:
-                return str(obj.get(field)) == supabase_user_id
+        # Check various user_id field names (keys on Supabase dicts, attributes otherwise)
+        lookup = obj.get if isinstance(obj, dict) else partial(getattr, obj)
+        for field in _OWNER_FIELDS:
+            value = lookup(field, _MISSING)
+            if value is not _MISSING:
+                return str(value) == supabase_user_id
         
         return False
 
@@ -55,14 +60,15 @@ class IsOwner(BasePermission):
 class IsSubscriptionActive(BasePermission):
     """Check if user has active subscription for premium features."""
     
-    def has_permission(self, request, view):
+    def has_permission(self, request, view, obj=None):
         # TODO: Implement subscription check
         # For now, allow all authenticated users
         # Later: Check subscription status from database
-        return request.user and request.user.is_authenticated
+        user = request.user
+        return user is not None and user.is_authenticated
     
-    def has_object_permission(self, request, view, obj):
-        return self.has_permission(request, view)
+    # Same check for objects; obj is accepted and ignored
+    has_object_permission = has_permission
 
 
 
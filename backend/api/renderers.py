@@ -0,0 +1,35 @@
+"""
+Custom DRF renderers.
+"""
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    
+    orjson natively encodes dicts, lists, datetimes, UUIDs and dataclasses in C;
+    anything else (Decimal, lazy translation strings, ...) goes through DRF's
+    JSONEncoder. Falls back to the stock JSONRenderer if orjson is not installed.
+    """
+    _encoder = encoders.JSONEncoder()
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not ORJSON_AVAILABLE:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        if data is None:
+            return b''
+        
+        return orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
@@ -4,6 +4,13 @@ Serializers for job search and matching endpoints.
 from rest_framework import serializers
 from typing import Optional, List, Dict, Any
 
+_JOB_DESCRIPTION_MIN_LENGTH = 30
+_JOB_DESCRIPTION_EMPTY_ERROR = 'Job description cannot be empty. Please paste the full job posting text.'
+_JOB_DESCRIPTION_TOO_SHORT_ERROR = (
+    'Job description is too short ({} characters). Please provide at least 30 characters of the job posting '
+    'for accurate matching. Include details like required skills, responsibilities, and qualifications.'
+)
+
 
 class JobSearchRequestSerializer(serializers.Serializer):
     """Serializer for job search request."""
@@ -57,7 +64,7 @@ class JobMatchAllRequestSerializer(serializers.Serializer):
     """Serializer for matching all resumes against job description."""
     job_description = serializers.CharField(
         required=True, 
-        min_length=30,
+        min_length=_JOB_DESCRIPTION_MIN_LENGTH,
         error_messages={
             'required': 'Job description is required. Please provide the job posting text.',
             'min_length': 'Job description must be at least 30 characters long. Please provide a more detailed job description for better matching results.'
@@ -67,18 +74,16 @@ class JobMatchAllRequestSerializer(serializers.Serializer):
     
     def validate_job_description(self, value):
         """Custom validation for job description."""
-        if not value or not value.strip():
-            raise serializers.ValidationError(
-                'Job description cannot be empty. Please paste the full job posting text.'
-            )
+        stripped = value.strip() if value else ''
+        if not stripped:
+            raise serializers.ValidationError(_JOB_DESCRIPTION_EMPTY_ERROR)
         
         # Check if it's just whitespace
-        if len(value.strip()) < 30:
-            raise serializers.ValidationError(
-                f'Job description is too short ({len(value.strip())} characters). Please provide at least 30 characters of the job posting for accurate matching. Include details like required skills, responsibilities, and qualifications.'
-            )
+        length = len(stripped)
+        if length < _JOB_DESCRIPTION_MIN_LENGTH:
+            raise serializers.ValidationError(_JOB_DESCRIPTION_TOO_SHORT_ERROR.format(length))
         
-        return value.strip()
+        return stripped
 
 
 class CategoryMatchSerializer(serializers.Serializer):
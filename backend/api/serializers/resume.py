@@ -165,10 +165,15 @@ class ResumeCreateSerializer(serializers.Serializer):
 
 
 class ResumeListSerializer(serializers.Serializer):
-    """Serializer for listing resumes (minimal data)."""
+    """
+    Serializer for listing resumes (minimal data).
+    
+    Takes rows selected with RESUME_LIST_COLUMNS, which already alias summary
+    to professional_tagline.
+    """
     id = serializers.UUIDField(read_only=True)
     title = serializers.CharField(read_only=True)
-    professional_tagline = serializers.CharField(source='summary', read_only=True)
+    professional_tagline = serializers.CharField(read_only=True, allow_null=True)
     status = serializers.CharField(read_only=True)
     last_template = serializers.CharField(read_only=True)
     last_font = serializers.CharField(read_only=True)
@@ -0,0 +1,6 @@
+"""
+Celery tasks for the API app (found by the Celery app's autodiscover_tasks()).
+"""
+from api.tasks.ai import parse_resume_task
+
+__all__ = ('parse_resume_task',)
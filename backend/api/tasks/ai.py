@@ -0,0 +1,32 @@
+"""
+Celery tasks for AI endpoints.
+"""
+import base64
+import logging
+from typing import Any, Dict
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True)
+def parse_resume_task(self, file_b64: str, filename: str, content_type: str) -> Dict[str, Any]:
+    """
+    Parse an uploaded resume file off the web worker.
+    
+    The result is stored in the Celery result backend (Redis) under the task
+    ID, where the task-status endpoint reads it.
+    
+    Args:
+        file_b64: File content, base64 encoded (tasks are JSON serialized)
+        filename: Original filename
+        content_type: MIME type of the upload
+        
+    Returns:
+        Dict: ResumeParser.parse_file() result
+    """
+    from config.files.parser import ResumeParser
+    
+    logger.info(f"Parsing resume file {filename} (task {self.request.id})")
+    return ResumeParser().parse_file(base64.b64decode(file_b64), filename, content_type)
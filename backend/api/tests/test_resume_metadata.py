@@ -0,0 +1,202 @@
+"""
+Unit tests for resume metadata updates and list ETags.
+
+The Supabase-backed ResumeService is mocked; no network access is needed.
+"""
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.views.resumes import ResumeViewSet, _metadata_etag
+
+USER_ID = '11111111-1111-1111-1111-111111111111'
+OTHER_USER_ID = '22222222-2222-2222-2222-222222222222'
+RESUME_ID = '33333333-3333-3333-3333-333333333333'
+
+
+def _stored_resume(**overrides):
+    resume = {
+        'id': RESUME_ID,
+        'user_id': USER_ID,
+        'title': 'My Resume',
+        'last_template': 'modern',
+        'last_font': 'inter',
+        'status': 'draft',
+    }
+    resume.update(overrides)
+    return resume
+
+
+@override_settings(SUPABASE_RLS_ENFORCED=False)
+class UpdateMetadataTestCase(SimpleTestCase):
+    """Tests for PATCH /api/v1/resumes/{id}/metadata/."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = ResumeViewSet.as_view({'patch': 'update_metadata'})
+        service_patcher = patch('api.views.resumes.ResumeService')
+        self.service = service_patcher.start().return_value
+        self.addCleanup(service_patcher.stop)
+        user_patcher = patch('api.views.resumes.get_supabase_user_id', return_value=USER_ID)
+        user_patcher.start()
+        self.addCleanup(user_patcher.stop)
+
+    def _patch(self, data, **headers):
+        request = self.factory.patch(f'/api/v1/resumes/{RESUME_ID}/metadata/', data, format='json', **headers)
+        force_authenticate(request, user=Mock(is_authenticated=True))
+        return self.view(request, pk=RESUME_ID)
+
+    def test_update_without_if_match(self):
+        """Without If-Match the owned update is written and its ETag returned."""
+        updated = _stored_resume(last_template='classic')
+        self.service.update_if_owned.return_value = updated
+
+        response = self._patch({'last_template': 'classic'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.service.update_if_owned.assert_called_once_with(RESUME_ID, USER_ID, {'last_template': 'classic'})
+        self.service.get_by_id.assert_not_called()
+        self.assertEqual(response['ETag'], _metadata_etag(RESUME_ID, updated))
+
+    def test_if_match_current_etag_writes_conditionally(self):
+        """A matching If-Match writes only while the stored metadata is unchanged."""
+        stored = _stored_resume()
+        updated = _stored_resume(last_font='lora')
+        self.service.get_by_id.return_value = stored
+        self.service.update_if_owned.return_value = updated
+
+        response = self._patch({'last_font': 'lora'}, HTTP_IF_MATCH=_metadata_etag(RESUME_ID, stored))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.service.update_if_owned.assert_called_once_with(
+            RESUME_ID,
+            USER_ID,
+            {'last_font': 'lora'},
+            expected={'last_template': 'modern', 'last_font': 'inter'}
+        )
+        self.assertEqual(response['ETag'], _metadata_etag(RESUME_ID, updated))
+
+    def test_if_match_star_and_etag_lists(self):
+        """If-Match accepts *, a list containing the current ETag, and its weak form."""
+        stored = _stored_resume()
+        etag = _metadata_etag(RESUME_ID, stored)
+        self.service.get_by_id.return_value = stored
+        self.service.update_if_owned.return_value = _stored_resume(last_font='lora')
+
+        for if_match in ('*', f'"stale", {etag}', f'W/{etag}'):
+            with self.subTest(if_match=if_match):
+                self.service.update_if_owned.reset_mock()
+                response = self._patch({'last_font': 'lora'}, HTTP_IF_MATCH=if_match)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.service.update_if_owned.assert_called_once()
+
+    def test_if_match_list_without_current_etag_is_rejected(self):
+        """A list of ETags none of which is current gets 412."""
+        self.service.get_by_id.return_value = _stored_resume()
+
+        response = self._patch({'last_font': 'lora'}, HTTP_IF_MATCH='"stale1", "stale2"')
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.service.update_if_owned.assert_not_called()
+
+    def test_if_match_stale_etag_is_rejected(self):
+        """An ETag that no longer describes the stored metadata gets 412 and no write."""
+        stored = _stored_resume()
+        self.service.get_by_id.return_value = stored
+        stale_etag = _metadata_etag(RESUME_ID, _stored_resume(last_template='classic'))
+
+        response = self._patch({'last_font': 'lora'}, HTTP_IF_MATCH=stale_etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response['ETag'], _metadata_etag(RESUME_ID, stored))
+        self.service.update_if_owned.assert_not_called()
+
+    def test_if_match_from_payload_does_not_skip_checks(self):
+        """An ETag computed from the request payload does not bypass ownership."""
+        self.service.get_by_id.return_value = _stored_resume(user_id=OTHER_USER_ID)
+        payload = {'last_template': 'modern', 'last_font': 'inter'}
+
+        response = self._patch(payload, HTTP_IF_MATCH=_metadata_etag(RESUME_ID, payload))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.service.update_if_owned.assert_not_called()
+
+    def test_if_match_missing_resume(self):
+        """If-Match on a resume that does not exist is 404."""
+        self.service.get_by_id.return_value = None
+
+        response = self._patch({'last_font': 'lora'}, HTTP_IF_MATCH='"abc"')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_concurrent_change_after_check_is_rejected(self):
+        """If the conditional UPDATE matches no row, the metadata changed meanwhile: 412."""
+        stored = _stored_resume()
+        self.service.get_by_id.return_value = stored
+        self.service.update_if_owned.return_value = None
+
+        response = self._patch({'last_font': 'lora'}, HTTP_IF_MATCH=_metadata_etag(RESUME_ID, stored))
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_unchanged_values_skip_the_write(self):
+        """Resending the stored values with a current ETag answers 200 without writing."""
+        stored = _stored_resume()
+        self.service.get_by_id.return_value = stored
+        etag = _metadata_etag(RESUME_ID, stored)
+
+        response = self._patch({'last_template': 'modern', 'last_font': 'inter'}, HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], etag)
+        self.service.update_if_owned.assert_not_called()
+
+
+@override_settings(SUPABASE_RLS_ENFORCED=False)
+class ResumeListETagTestCase(SimpleTestCase):
+    """Tests for GET /api/v1/resumes/ ETags."""
+
+    ROWS = [{
+        'id': RESUME_ID,
+        'title': 'My Resume',
+        'professional_tagline': 'Backend engineer',
+        'status': 'draft',
+        'last_template': 'modern',
+        'last_font': 'inter',
+        'created_at': '2025-01-01T00:00:00+00:00',
+        'updated_at': '2025-01-02T00:00:00+00:00',
+    }]
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = ResumeViewSet.as_view({'get': 'list'})
+        service_patcher = patch('api.views.resumes.ResumeService')
+        service_patcher.start().return_value.get_user_resume_list.return_value = self.ROWS
+        self.addCleanup(service_patcher.stop)
+        user_patcher = patch('api.views.resumes.get_supabase_user_id', return_value=USER_ID)
+        user_patcher.start()
+        self.addCleanup(user_patcher.stop)
+
+    def _get(self, **headers):
+        request = self.factory.get('/api/v1/resumes/', **headers)
+        force_authenticate(request, user=Mock(is_authenticated=True))
+        return self.view(request)
+
+    def test_if_none_match_returns_304(self):
+        """Sending back the list's ETag gets 304 Not Modified."""
+        etag = self._get()['ETag']
+
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_serializer_fallback_keeps_tagline(self):
+        """Without orjson the serialized rows still carry professional_tagline."""
+        with patch('api.views.resumes.ORJSON_AVAILABLE', False):
+            response = self._get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['professional_tagline'], 'Backend engineer')
@@ -0,0 +1,184 @@
+"""
+Unit tests for the guest AI throttles.
+
+Counting runs against LocMemCache (the backend used when CACHE_URL is unset).
+"""
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import Throttled
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.throttles import _core
+from api.throttles.ai import GuestAIRateLimiter, GuestThrottle
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'throttle-tests',
+    }
+}
+
+
+def _guest_request(path='/api/v1/ai/enhance-summary/', method='post', **extra):
+    """Build a DRF request without credentials."""
+    factory = APIRequestFactory()
+    extra.setdefault('REMOTE_ADDR', '203.0.113.7')
+    extra.setdefault('HTTP_USER_AGENT', 'test-agent')
+    return Request(getattr(factory, method)(path, **extra))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, GUEST_THROTTLE_TTL_JITTER=0)
+class CheckAndIncrementTestCase(SimpleTestCase):
+    """Tests for counting requests against a window counter."""
+
+    def setUp(self):
+        cache.clear()
+        _core._block_cache.clear()
+
+    def test_allows_up_to_limit(self):
+        """Requests up to the limit pass; the next one is refused."""
+        self.assertEqual(_core.check_and_increment('t:limit', 2, 60), (True, 1, None))
+        self.assertEqual(_core.check_and_increment('t:limit', 2, 60), (True, 2, None))
+        self.assertEqual(_core.check_and_increment('t:limit', 2, 60), (False, 3, None))
+
+    def test_counters_are_independent(self):
+        """Each cache key has its own count."""
+        _core.check_and_increment('t:a', 1, 60)
+        allowed, count, _ = _core.check_and_increment('t:b', 1, 60)
+        self.assertTrue(allowed)
+        self.assertEqual(count, 1)
+
+    def test_expired_counter_starts_a_new_window(self):
+        """Once the counter is gone the guest is allowed again."""
+        _core.check_and_increment('t:expire', 1, 60)
+        self.assertFalse(_core.check_and_increment('t:expire', 1, 60)[0])
+
+        cache.delete('t:expire')
+
+        self.assertEqual(_core.check_and_increment('t:expire', 1, 60), (True, 1, None))
+
+    def test_expiry_between_add_and_incr_restarts_count(self):
+        """If the key expires between add() and incr(), the add() winner starts at 1."""
+        with patch.object(_core, 'cache') as mock_cache:
+            mock_cache.add.side_effect = [False, True]
+            mock_cache.incr.side_effect = ValueError
+            self.assertEqual(_core._increment('t:race', 60), (1, None))
+            mock_cache.add.assert_called_with('t:race', 1, timeout=60)
+
+    def test_expiry_between_add_and_incr_joins_new_window(self):
+        """A request losing the re-add counts against the window another request started."""
+        with patch.object(_core, 'cache') as mock_cache:
+            mock_cache.add.side_effect = [False, False]
+            mock_cache.incr.side_effect = [ValueError, 2]
+            self.assertEqual(_core._increment('t:race', 60), (2, None))
+
+    def test_known_blocked_counter_skips_cache(self):
+        """A counter recorded as blocked is answered without another increment."""
+        _core._decide('t:blocked', 1, 2, 30)
+
+        allowed, count, ttl = _core.check_and_increment('t:blocked', 1, 60)
+
+        self.assertFalse(allowed)
+        self.assertEqual(count, 2)
+        self.assertLessEqual(ttl, 31)
+        self.assertIsNone(cache.get('t:blocked'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, GUEST_THROTTLE_TTL_JITTER=0)
+class GuestThrottleTestCase(SimpleTestCase):
+    """Tests for the enhance-summary guest throttle."""
+
+    def setUp(self):
+        cache.clear()
+        _core._block_cache.clear()
+
+    def test_wait_defaults_to_window(self):
+        """Before any refusal wait() reports the full 24 hour window."""
+        self.assertEqual(GuestThrottle().wait(), 86400)
+
+    def test_second_guest_call_is_throttled(self):
+        """A guest gets one call; the second raises Throttled with the window as wait."""
+        throttle = GuestThrottle()
+        self.assertTrue(throttle.allow_request(_guest_request(), None))
+
+        with self.assertRaises(Throttled) as ctx:
+            throttle.allow_request(_guest_request(), None)
+
+        # LocMemCache reports no TTL, so the full window is used
+        self.assertEqual(ctx.exception.wait, 86400)
+        self.assertEqual(throttle.wait(), 86400)
+
+    def test_wait_uses_remaining_ttl(self):
+        """When the backend reports the counter's TTL, it becomes the wait."""
+        throttle = GuestThrottle()
+        with patch('api.throttles.ai.check_and_increment', return_value=(False, 2, 120)):
+            with self.assertRaises(Throttled) as ctx:
+                throttle.allow_request(_guest_request(), None)
+
+        self.assertEqual(ctx.exception.wait, 120)
+        self.assertEqual(throttle.wait(), 120)
+
+    def test_limiter_counts_per_feature(self):
+        """GuestAIRateLimiter applies each feature's own limit."""
+        for _ in range(GuestAIRateLimiter.LIMITS['parse_resume_file']):
+            self.assertTrue(GuestAIRateLimiter(_guest_request()).allow('parse_resume_file'))
+        self.assertFalse(GuestAIRateLimiter(_guest_request()).allow('parse_resume_file'))
+        self.assertTrue(GuestAIRateLimiter(_guest_request()).allow('analyze_resume'))
+
+
+class BuildFingerprintTestCase(SimpleTestCase):
+    """Tests for guest fingerprinting."""
+
+    def test_cookie_and_header_guest_id_match(self):
+        """The same guest_id gives the same fingerprint from the cookie or the header."""
+        from_cookie = _core.build_fingerprint(_guest_request(HTTP_COOKIE='guest_id=abc123'))
+        from_header = _core.build_fingerprint(_guest_request(HTTP_X_GUEST_ID='abc123'))
+        self.assertEqual(from_cookie, from_header)
+
+    def test_guest_id_takes_precedence_over_ip(self):
+        """With a guest_id, IP and User-Agent do not affect the fingerprint."""
+        first = _core.build_fingerprint(_guest_request(HTTP_X_GUEST_ID='abc123', REMOTE_ADDR='198.51.100.1'))
+        second = _core.build_fingerprint(_guest_request(HTTP_X_GUEST_ID='abc123', REMOTE_ADDR='198.51.100.2'))
+        self.assertEqual(first, second)
+
+    def test_ip_and_user_agent_fallback(self):
+        """Without a guest_id, IP + User-Agent identify the guest."""
+        same_a = _core.build_fingerprint(_guest_request())
+        same_b = _core.build_fingerprint(_guest_request())
+        other_ip = _core.build_fingerprint(_guest_request(REMOTE_ADDR='198.51.100.9'))
+        other_agent = _core.build_fingerprint(_guest_request(HTTP_USER_AGENT='other-agent'))
+        self.assertEqual(same_a, same_b)
+        self.assertNotEqual(same_a, other_ip)
+        self.assertNotEqual(same_a, other_agent)
+
+    def test_client_ip_preferred_over_remote_addr(self):
+        """The proxy-aware client_ip set by ClientIPMiddleware wins over REMOTE_ADDR."""
+        request = _guest_request(REMOTE_ADDR='10.0.0.1')
+        request.client_ip = '203.0.113.7'
+        self.assertEqual(_core.build_fingerprint(request), _core.build_fingerprint(_guest_request()))
+
+    def test_body_guest_id_is_ignored(self):
+        """guest_id in the request body is never read."""
+        factory = APIRequestFactory()
+        with_body = Request(factory.post(
+            '/api/v1/ai/analyze-resume/', {'guest_id': 'abc123'}, format='json',
+            REMOTE_ADDR='203.0.113.7', HTTP_USER_AGENT='test-agent',
+        ))
+        self.assertEqual(_core.build_fingerprint(with_body), _core.build_fingerprint(_guest_request()))
+
+    def test_fingerprint_is_memoized(self):
+        """Repeated calls for one request reuse the first hash."""
+        request = _guest_request()
+        fingerprint = _core.build_fingerprint(request)
+        with patch.object(_core, '_fingerprint_digest') as digest:
+            self.assertEqual(_core.build_fingerprint(request), fingerprint)
+            digest.assert_not_called()
+
+    def test_digest_length(self):
+        """BLAKE2b fingerprints are 16 hex characters; the hmac scheme gives 40."""
+        self.assertEqual(len(_core.build_fingerprint(_guest_request())), 16)
+        with override_settings(GUEST_FINGERPRINT_HASH='hmac'):
+            self.assertEqual(len(_core.build_fingerprint(_guest_request())), 40)
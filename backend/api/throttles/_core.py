@@ -0,0 +1,255 @@
+"""
+Shared guest fingerprinting and counting for the throttles.
+
+Counters live in the default Django cache. With the Redis cache a Lua
+script counts a request in one round trip; other backends use atomic
+add/incr. The per-process LocMemCache (used when CACHE_URL is unset) only
+counts within one worker; production needs the shared Redis cache for the
+limits to hold across gunicorn workers.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+from django.utils.crypto import salted_hmac
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Count a request and report the window's remaining TTL in a single round trip
+_RATE_LIMIT_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('TTL', KEYS[1])}
+"""
+
+_rate_limit_script = None
+# Cleared when the Redis server refuses scripts (e.g. EVAL disabled); counting is then pipelined
+_scripting_available = True
+
+# Process-local record of counters known to be over their limit: cache key -> monotonic
+# deadline. Blocked guests are answered without a cache round trip until their window ends.
+_BLOCK_CACHE_SIZE = 10_000
+_block_cache: OrderedDict = OrderedDict()
+_block_cache_lock = threading.Lock()
+
+# Key for guest fingerprints, derived from SECRET_KEY once per process
+_FP_KEY = hashlib.blake2b(settings.SECRET_KEY.encode('utf-8'), digest_size=64, person=b'guest_ai_fp').digest()
+
+
+def _increment(cache_key: str, window: int) -> Tuple[int, Optional[int]]:
+    """
+    Atomically count a request against a window counter.
+
+    On the Redis cache this is one EVALSHA of _RATE_LIMIT_LUA (redis-py
+    reloads the script on NOSCRIPT), or one pipelined INCR/EXPIRE NX/TTL
+    round trip where the server does not allow scripts. Elsewhere add()
+    only creates the key when it is missing, so concurrent first requests
+    cannot overwrite each other's counts the way get-then-set did.
+
+    New counters get a TTL of the window plus up to GUEST_THROTTLE_TTL_JITTER
+    seconds, so a burst of guests does not expire (and start over) in lockstep.
+
+    Args:
+        cache_key: Counter key
+        window: Window length in seconds (counter TTL)
+
+    Returns:
+        Tuple of (count including this request, seconds left in the window or None if unknown)
+    """
+    global _rate_limit_script, _scripting_available
+
+    jitter = settings.GUEST_THROTTLE_TTL_JITTER
+    if jitter > 0:
+        window += random.randint(0, jitter)
+
+    backend = caches['default']
+    if isinstance(backend, RedisCache):
+        key = backend.make_and_validate_key(cache_key)
+        client = backend._cache.get_client(key, write=True)
+        if _scripting_available:
+            from redis.exceptions import ResponseError
+
+            if _rate_limit_script is None:
+                _rate_limit_script = client.register_script(_RATE_LIMIT_LUA)
+            try:
+                count, ttl = _rate_limit_script(keys=[key], args=[window], client=client)
+                return count, ttl
+            except ResponseError as e:
+                logger.warning(f"Redis scripting unavailable for guest throttles, pipelining instead: {e}")
+                _scripting_available = False
+        return _pipeline_increment(client, key, window)
+
+    cache.add(cache_key, 0, timeout=window)
+    try:
+        return cache.incr(cache_key), None
+    except ValueError:
+        # Key expired between add and incr. add() elects a single request to start
+        # the new window; concurrent ones count against it instead of resetting it.
+        if cache.add(cache_key, 1, timeout=window):
+            return 1, None
+        try:
+            return cache.incr(cache_key), None
+        except ValueError:
+            return 1, None
+
+
+def _pipeline_increment(client, key: str, window: int) -> Tuple[int, Optional[int]]:
+    """
+    Count a request with INCR, EXPIRE NX and TTL in one pipelined round trip.
+
+    EXPIRE NX (Redis 7+) only sets the TTL on the request that created the
+    counter, like the Lua script does.
+
+    Args:
+        client: redis-py client for the key
+        key: Full (prefixed, versioned) cache key
+        window: Counter TTL in seconds
+
+    Returns:
+        Tuple of (count including this request, seconds left in the window)
+    """
+    pipe = client.pipeline(transaction=False)
+    pipe.incr(key)
+    pipe.expire(key, window, nx=True)
+    pipe.ttl(key)
+    count, _, ttl = pipe.execute()
+    return count, ttl
+
+
+def check_and_increment(cache_key: str, limit: int, window: int) -> Tuple[bool, int, Optional[int]]:
+    """
+    Count a request and decide whether it is within the limit.
+
+    Args:
+        cache_key: Counter key
+        limit: Requests allowed per window
+        window: Window length in seconds
+
+    Returns:
+        Tuple of (allowed, count including this request, seconds left in the window or None if unknown)
+    """
+    blocked = _blocked_result(cache_key, limit)
+    if blocked is not None:
+        return blocked
+
+    count, ttl = _increment(cache_key, window)
+    return _decide(cache_key, limit, count, ttl)
+
+
+def _blocked_result(cache_key: str, limit: int) -> Optional[Tuple[bool, int, Optional[int]]]:
+    """Answer for a counter recorded as blocked in this process, or None to ask the cache."""
+    deadline = _block_cache.get(cache_key)
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            return False, limit + 1, int(remaining) + 1
+    return None
+
+
+def _decide(cache_key: str, limit: int, count: int, ttl: Optional[int]) -> Tuple[bool, int, Optional[int]]:
+    """Compare a fresh count against its limit, remembering the counter if it is now blocked."""
+    allowed = count <= limit
+    if not allowed and ttl and ttl > 0:
+        _remember_block(cache_key, ttl)
+    return allowed, count, ttl
+
+
+def _remember_block(cache_key: str, ttl: int) -> None:
+    """Record a blocked counter until its window ends, evicting expired and oldest entries."""
+    now = time.monotonic()
+    with _block_cache_lock:
+        _block_cache[cache_key] = now + ttl
+        _block_cache.move_to_end(cache_key)
+        while _block_cache:
+            oldest_key, oldest_deadline = next(iter(_block_cache.items()))
+            if oldest_deadline > now and len(_block_cache) <= _BLOCK_CACHE_SIZE:
+                break
+            del _block_cache[oldest_key]
+
+
+def has_credentials(request) -> bool:
+    """
+    Check whether a request carries any credentials an authenticator could accept.
+
+    Looks for a JWT (Authorization header, or the token query parameter
+    allowed on GET downloads) or a session cookie. Without any of them the
+    request is a guest's, and resolving the user can be skipped.
+    """
+    return bool(
+        request.META.get('HTTP_AUTHORIZATION')
+        or settings.SESSION_COOKIE_NAME in request.COOKIES
+        or (request.method == 'GET' and 'token' in request.query_params)
+    )
+
+
+def _fingerprint_digest(raw: bytes) -> str:
+    """
+    Hash a guest's identifying bytes into a cache-key component.
+
+    Keyed BLAKE2b is a single pass over the input, where salted_hmac derives a
+    key and runs two SHA-1 passes per call. The BLAKE2b digest is 8 bytes (16
+    hex characters, keeping cache keys short). It has no time component: the
+    fingerprint is part of the counter keys, so it must stay the same for the
+    whole throttle window.
+
+    Args:
+        raw: guest_id or IP + User-Agent, already encoded
+
+    Returns:
+        str: Hex digest
+    """
+    if settings.GUEST_FINGERPRINT_HASH == 'hmac':
+        return salted_hmac('guest_ai_fingerprint', raw).hexdigest()
+    return hashlib.blake2b(raw, key=_FP_KEY, digest_size=8).hexdigest()
+
+
+def build_fingerprint(request) -> str:
+    """
+    Create a stable fingerprint for an unauthenticated user.
+
+    Prefers a guest ID (guest_id cookie, X-Guest-Id header or guest_id query
+    parameter) if available, otherwise uses IP + User-Agent. The request body
+    is never read: that would make DRF parse it (e.g. whole multipart
+    uploads) before the view runs, so clients sending guest_id in the body
+    must also send it as X-Guest-Id. The result is memoized on the request,
+    so every throttle and feature checked for the same request shares one hash.
+
+    Args:
+        request: DRF request object
+
+    Returns:
+        str: Hex digest identifying the guest
+    """
+    fingerprint = getattr(request, '_guest_ai_fp', None)
+    if fingerprint:
+        return fingerprint
+
+    # Try to get guest_id from cookie, header or query params
+    guest_id = (
+        request.COOKIES.get('guest_id')
+        or request.META.get('HTTP_X_GUEST_ID')
+        or request.query_params.get('guest_id')
+    )
+
+    if guest_id:
+        raw = b'guest:' + str(guest_id).encode('utf-8')
+    else:
+        # Fallback to IP + User-Agent
+        ip = getattr(request, 'client_ip', None) or request.META.get('REMOTE_ADDR', 'unknown')
+        user_agent = request.META.get('HTTP_USER_AGENT', 'unknown')
+        # WSGI header values are latin-1 decoded strings, so this encoding is lossless
+        raw = b':'.join((ip.encode('latin-1', 'replace'), user_agent.encode('latin-1', 'replace')))
+
+    fingerprint = request._guest_ai_fp = _fingerprint_digest(raw)
+    return fingerprint
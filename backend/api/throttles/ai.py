@@ -1,23 +1,30 @@
 """
 Server-side throttles for guest AI usage.
+
+Fingerprinting and counting are shared in api.throttles._core.
 """
 from __future__ import annotations
 
-from django.core.cache import cache
-from django.utils.crypto import salted_hmac
+from types import MappingProxyType
 from typing import Optional
 from rest_framework.throttling import BaseThrottle
 from rest_framework.exceptions import Throttled
-from api.auth.utils import get_supabase_user_id
+from api.auth.utils import get_cached_supabase_user_id
+from api.throttles._core import build_fingerprint, check_and_increment, has_credentials
+
+# Guest throttle window: 24 hours
+_DAY = 86400
+
+_THROTTLED_DETAIL = "Guests limited to one AI summary enhancement. Sign up for unlimited."
 
 
 class GuestAIRateLimiter:
     """
     Rate limiter for unauthenticated users hitting AI endpoints.
-    Uses IP + User-Agent (+ guest_id cookie when available) to fingerprint guests.
+    Uses IP + User-Agent (+ guest_id cookie or X-Guest-Id header when available) to fingerprint guests.
     """
 
-    WINDOW = 24 * 60 * 60  # 24 hours
+    WINDOW = _DAY
 
     LIMITS = {
         'parse_resume_file': 2,
@@ -26,9 +33,13 @@ class GuestAIRateLimiter:
         'enhance_summary': 1,  # Limited to 1 call per 24h for guests
     }
 
+    # One instance per request; no per-instance __dict__
+    __slots__ = ('request', 'user_id', '_fingerprint')
+
     def __init__(self, request):
         self.request = request
-        self.user_id = get_supabase_user_id(request)
+        # Guests send no credentials, so skip resolving a user for them
+        self.user_id = get_cached_supabase_user_id(request) if has_credentials(request) else ''
         self._fingerprint: Optional[str] = None
 
     def is_authenticated(self) -> bool:
@@ -46,28 +57,11 @@ class GuestAIRateLimiter:
             self._fingerprint = str(self.user_id)
             return self._fingerprint
 
-        guest_id = (
-            self.request.COOKIES.get('guest_id')
-            or self.request.query_params.get('guest_id')
-            or (hasattr(self.request, 'data') and self.request.data.get('guest_id'))
-        )
-
-        if guest_id:
-            raw = f"guest:{guest_id}"
-        else:
-            ip = (
-                self.request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0].strip()
-                or self.request.META.get('REMOTE_ADDR', 'unknown')
-            )
-            user_agent = self.request.META.get('HTTP_USER_AGENT', 'unknown')
-            raw = f"{ip}:{user_agent}"
-
-        self._fingerprint = salted_hmac('guest_ai_fingerprint', raw).hexdigest()
+        self._fingerprint = build_fingerprint(self.request)
         return self._fingerprint
 
     def _cache_key(self, feature: str) -> str:
-        fingerprint = self._build_fingerprint()
-        return f"guest_ai:{feature}:{fingerprint}"
+        return _FEATURE_CFG[feature][1] + self._build_fingerprint()
 
     def allow(self, feature: str) -> bool:
         """
@@ -76,36 +70,30 @@ class GuestAIRateLimiter:
         if self.is_authenticated():
             return True
 
-        limit = self.LIMITS.get(feature)
-        if limit is None:
+        cfg = _FEATURE_CFG.get(feature)
+        if cfg is None:
             return True
+        limit, key_prefix = cfg
 
-        cache_key = self._cache_key(feature)
-        count = cache.get(cache_key)
+        allowed, _, _ = check_and_increment(key_prefix + self._build_fingerprint(), limit, self.WINDOW)
+        return allowed
 
-        if count is None:
-            cache.set(cache_key, 1, timeout=self.WINDOW)
-            return True
-
-        if count >= limit:
-            return False
 
-        try:
-            cache.incr(cache_key)
-        except ValueError:
-            # Key expired between get and incr, reset count
-            cache.set(cache_key, 1, timeout=self.WINDOW)
-        return True
+# Per-feature (limit, cache key prefix), built once so allow() does a single lookup
+_FEATURE_CFG = MappingProxyType({
+    feature: (limit, f"guest_ai:{feature}:")
+    for feature, limit in GuestAIRateLimiter.LIMITS.items()
+})
 
 
 class GuestThrottle(BaseThrottle):
     """
     DRF throttle class for limiting guest users to 1 call per 24 hours for enhance-summary.
-    Uses IP + User-Agent (or guest_id cookie if exists) to identify guests.
+    Uses IP + User-Agent (or guest_id cookie / X-Guest-Id header if exists) to identify guests.
     Authenticated users are unlimited.
     """
     
-    WINDOW = 24 * 60 * 60  # 24 hours
+    WINDOW = _DAY
     LIMIT = 1  # 1 call per 24 hours for enhance-summary
     
     def get_ident(self, request):
@@ -113,30 +101,11 @@ class GuestThrottle(BaseThrottle):
         Identify the user making the request.
         Returns user_id if authenticated, otherwise a fingerprint based on IP + User-Agent or guest_id.
         """
-        user_id = get_supabase_user_id(request)
+        user_id = get_cached_supabase_user_id(request) if has_credentials(request) else ''
         if user_id:
             return f"user:{user_id}"
         
-        # Try to get guest_id from cookie or query params
-        guest_id = (
-            request.COOKIES.get('guest_id')
-            or request.query_params.get('guest_id')
-            or (hasattr(request, 'data') and request.data.get('guest_id'))
-        )
-        
-        if guest_id:
-            raw = f"guest:{guest_id}"
-        else:
-            # Fallback to IP + User-Agent
-            ip = (
-                request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0].strip()
-                or request.META.get('REMOTE_ADDR', 'unknown')
-            )
-            user_agent = request.META.get('HTTP_USER_AGENT', 'unknown')
-            raw = f"{ip}:{user_agent}"
-        
-        # Create a stable hash for the fingerprint
-        return salted_hmac('guest_ai_fingerprint', raw).hexdigest()
+        return build_fingerprint(request)
     
     def get_cache_key(self, request, view):
         """
@@ -159,27 +128,11 @@ class GuestThrottle(BaseThrottle):
         if cache_key is None:
             return True
         
-        # Check current count
-        count = cache.get(cache_key)
-        
-        if count is None:
-            # First request - set initial count
-            cache.set(cache_key, 1, timeout=self.WINDOW)
-            return True
-        
-        # Check if limit exceeded
-        if count >= self.LIMIT:
-            raise Throttled(
-                detail="Guests limited to one AI summary enhancement. Sign up for unlimited.",
-                wait=self.WINDOW
-            )
-        
-        # Increment count
-        try:
-            cache.incr(cache_key)
-        except ValueError:
-            # Key expired between get and incr, reset count
-            cache.set(cache_key, 1, timeout=self.WINDOW)
+        # Count this request, then check if limit exceeded
+        allowed, _, ttl = check_and_increment(cache_key, self.LIMIT, self.WINDOW)
+        if not allowed:
+            self._wait = ttl if ttl and ttl > 0 else self.WINDOW
+            raise Throttled(detail=_THROTTLED_DETAIL, wait=self._wait)
         
         return True
     
@@ -188,9 +141,9 @@ class GuestThrottle(BaseThrottle):
         Return the number of seconds to wait before retrying.
         For 24-hour window, return remaining time.
         """
-        # This is called when throttled, but we don't have access to the request here
-        # Return a reasonable wait time (24 hours in seconds)
-        return self.WINDOW
+        # Remaining TTL of the counter when the backend reports it,
+        # otherwise the full window (24 hours in seconds)
+        return getattr(self, '_wait', _DAY)
 
 
 
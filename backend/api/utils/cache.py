@@ -0,0 +1,123 @@
+"""
+Response caching for AI endpoints.
+"""
+import functools
+import hashlib
+import json
+import logging
+from typing import Callable, Optional, Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from rest_framework import status
+
+from api.auth.utils import get_cached_supabase_user_id
+from api.renderers import ORJSONRenderer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_renderer = ORJSONRenderer()
+
+
+def _canonical(value) -> bytes:
+    """Serialize a request value to stable bytes for hashing (sorted keys)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+
+
+def _cache_key(view, request, name: str, keys: Sequence[str]) -> Optional[str]:
+    """
+    Build the cache key for an AI request from its user and input fields.
+
+    With a resume_id the resume's current content (all sections) is hashed as
+    well, so editing the resume produces a new key. The user ID is part of
+    the key, so a cached response is only ever returned to the user it was
+    computed for (after the view's ownership checks passed).
+
+    Returns:
+        str: Cache key, or None if the request should not be cached
+    """
+    data = request.data
+    user_id = get_cached_supabase_user_id(request)
+    resume_id = data.get('resume_id')
+    if resume_id and not user_id:
+        # The view rejects resume_id for guests; don't load the resume just to hash it
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(name.encode('utf-8'))
+    digest.update(b'\0' + user_id.encode('utf-8'))
+    for field in keys:
+        digest.update(b'\0' + _canonical(data.get(field)))
+
+    if resume_id:
+        resume_data = view.resume_service.get_resume_with_details(resume_id)
+        if not resume_data:
+            return None
+        digest.update(b'\0' + _canonical(resume_data))
+
+    return f'ai_cache:{digest.hexdigest()}'
+
+
+def ai_cache(keys: Sequence[str], ttl: Optional[int] = None) -> Callable:
+    """
+    Cache successful responses of an AIViewSet action by the hash of its inputs.
+
+    The UI often re-submits identical input while the user iterates, and
+    each call otherwise re-runs the analyzer. Only use it on deterministic
+    endpoints: sampled generations (summaries) must not return the same
+    text on every retry. Hits are served from the default cache as
+    pre-rendered JSON. Only 200 responses are stored, and not those marked
+    ``Cache-Control: no-store`` by the view (e.g. degraded fallback results).
+    Clients can force a fresh result with a ``Cache-Control: no-cache``
+    request header. Throttles in the action's throttle_classes still run;
+    checks made inside the action body are skipped on a hit, since a hit
+    costs no AI call.
+
+    Apply it below @action, which must remain the outermost decorator.
+
+    Args:
+        keys: request.data fields that determine the response
+        ttl: Seconds to keep responses (defaults to AI_RESPONSE_CACHE_TIMEOUT; 0 disables)
+
+    Returns:
+        Decorator for viewset action methods
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            timeout = settings.AI_RESPONSE_CACHE_TIMEOUT if ttl is None else ttl
+            if not timeout:
+                return func(self, request, *args, **kwargs)
+
+            try:
+                key = _cache_key(self, request, func.__name__, keys)
+            except Exception as e:
+                logger.warning(f"Could not build AI cache key for {func.__name__}: {e}")
+                key = None
+            if key is None:
+                return func(self, request, *args, **kwargs)
+
+            if 'no-cache' not in request.META.get('HTTP_CACHE_CONTROL', ''):
+                body = cache.get(key)
+                if body is not None:
+                    return HttpResponse(body, content_type='application/json')
+
+            response = func(self, request, *args, **kwargs)
+            if (
+                response.status_code == status.HTTP_200_OK
+                and getattr(response, 'data', None) is not None
+                and 'no-store' not in response.get('Cache-Control', '')
+            ):
+                cache.set(key, _renderer.render(response.data), timeout)
+            return response
+        return wrapper
+    return decorator
@@ -1,8 +1,13 @@
 """
 AI service API views.
 """
+import base64
 import logging
+import re
+import threading
 from typing import List, Dict, Any, Optional
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -23,25 +28,81 @@ from api.serializers.ai import (
     JobMatchRequestSerializer,
     JobMatchResponseSerializer
 )
-from api.auth.utils import get_supabase_user_id
+from api.auth.utils import get_cached_supabase_user_id, get_supabase_user_id
+from api.renderers import ORJSONRenderer
+from api.throttles._core import build_fingerprint
 from api.throttles.ai import GuestAIRateLimiter, GuestThrottle
+from api.utils.cache import ai_cache
 from rest_framework.decorators import throttle_classes
 
 
+# Patterns for the rule-based suggestion fallback, compiled once per process
+_SKILLS_LINE_RE = re.compile(r'(skills|technologies|technical skills)[:.\s]*([^\n]*)', re.IGNORECASE)
+# Section headings that start (group 1) or end an experience section
+_SECTION_HEADING_RE = re.compile(r'(experience|work|employment|achievements)|education|skills|summary', re.IGNORECASE)
+# Any of these substrings marks an experience line as an accomplishment worth a bullet
+_ACTION_VERB_RE = re.compile(
+    'developed|implemented|created|managed|led|achieved|increased|improved', re.IGNORECASE
+)
+
+# Background resume parses: task ID -> submitter, kept until the result is delivered
+_PARSE_TASK_OWNER_KEY = 'resume_parse_task:{}'
+_PARSE_TASK_OWNER_TIMEOUT = 3600
+
+
+def _parse_task_owner(request) -> str:
+    """Identify who submitted a background parse: the Supabase user, else the guest fingerprint."""
+    user_id = get_cached_supabase_user_id(request)
+    return f'user:{user_id}' if user_id else f'guest:{build_fingerprint(request)}'
+
+
+_ai_services: Optional[Dict[str, Any]] = None
+_init_lock = threading.Lock()
+
+
+def _get_ai_services() -> Dict[str, Any]:
+    """
+    Get the AI services shared by every AIViewSet instance (created on first use).
+
+    DRF builds a new viewset per request; the services hold no per-request
+    state, so building them (and their Supabase/OpenAI/LangChain clients)
+    once per process saves that setup on every call.
+
+    Returns:
+        Dict mapping AIViewSet attribute names to service instances
+    """
+    global _ai_services
+    if _ai_services is None:
+        with _init_lock:
+            if _ai_services is None:
+                _ai_services = {
+                    'ats_analyzer': ATSAnalyzerService(),  # Fallback
+                    'enhanced_ats_analyzer': EnhancedATSAnalyzerService(),
+                    'suggestion_applier': SuggestionApplierService(),
+                    'summary_generator': SummaryGeneratorService(),
+                    'job_matcher': JobMatcherService(),
+                    'resume_service': ResumeService(),
+                }
+    return _ai_services
+
+
 class AIViewSet(viewsets.ViewSet):
     """
     API endpoints for AI services.
     """
     permission_classes = [IsAuthenticated]
+    # Analysis and match responses are large nested dicts/lists
+    renderer_classes = [ORJSONRenderer]
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.ats_analyzer = ATSAnalyzerService()  # Fallback
-        self.enhanced_ats_analyzer = EnhancedATSAnalyzerService()
-        self.suggestion_applier = SuggestionApplierService()
-        self.summary_generator = SummaryGeneratorService()
-        self.job_matcher = JobMatcherService()
-        self.resume_service = ResumeService()
+        services = _get_ai_services()
+        self.ats_analyzer = services['ats_analyzer']
+        self.enhanced_ats_analyzer = services['enhanced_ats_analyzer']
+        self.suggestion_applier = services['suggestion_applier']
+        self.summary_generator = services['summary_generator']
+        self.job_matcher = services['job_matcher']
+        self.resume_service = services['resume_service']
     
     def _guest_rate_limit(self, request, feature: str):
         limiter = GuestAIRateLimiter(request)
@@ -150,14 +211,27 @@ class AIViewSet(viewsets.ViewSet):
             )
         
         try:
-            # Read file content
-            file_content = uploaded_file.read()
             content_type = uploaded_file.content_type or 'application/pdf'
             
-            # Parse file
+            if settings.RESUME_PARSE_ASYNC:
+                # Parse on a Celery worker; the client polls task-status for the result
+                from api.tasks.ai import parse_resume_task
+                task = parse_resume_task.delay(
+                    base64.b64encode(uploaded_file.read()).decode('ascii'), uploaded_file.name, content_type
+                )
+                cache.set(
+                    _PARSE_TASK_OWNER_KEY.format(task.id), _parse_task_owner(request), _PARSE_TASK_OWNER_TIMEOUT
+                )
+                return Response(
+                    {'task_id': task.id, 'status': 'pending', 'success': True},
+                    status=status.HTTP_202_ACCEPTED
+                )
+            
+            # Parse file. The upload is handed over as an open file (Django spools large
+            # uploads to a temp file), so the parsers seek through it instead of a bytes copy.
             from config.files.parser import ResumeParser
             parser = ResumeParser()
-            parse_result = parser.parse_file(file_content, uploaded_file.name, content_type)
+            parse_result = parser.parse_file(uploaded_file, uploaded_file.name, content_type)
             
             if not parse_result.get('success', False):
                 return Response(
@@ -185,7 +259,89 @@ class AIViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @extend_schema(
+        operation_id='parse_resume_task_status',
+        responses={200: {
+            'type': 'object',
+            'properties': {
+                'task_id': {'type': 'string'},
+                'status': {'type': 'string'},
+                'text': {'type': 'string'},
+                'success': {'type': 'boolean'},
+                'error': {'type': 'string'}
+            }
+        }},
+        tags=['AI Services']
+    )
+    @action(detail=False, methods=['get'], url_path=r'task-status/(?P<task_id>[^/.]+)', permission_classes=[AllowAny])
+    def task_status(self, request, task_id=None):
+        """
+        Get the state of a background resume parse (see parse_resume_file).
+        
+        Only the user or guest that uploaded the file can read the result, and
+        only once: it is discarded after being delivered. Unknown task IDs,
+        including those of any other Celery task, answer 404.
+        
+        GET /api/v1/ai/task-status/<task_id>/
+        
+        Returns:
+        {
+            "task_id": "...",
+            "status": "pending" | "started" | "success" | "failure",
+            "text": "Extracted text from file",  # once finished
+            "success": true
+        }
+        """
+        from celery.result import AsyncResult
+        
+        owner_key = _PARSE_TASK_OWNER_KEY.format(task_id)
+        if cache.get(owner_key) != _parse_task_owner(request):
+            return Response(
+                {'error': 'Task not found', 'success': False},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        result = AsyncResult(task_id)
+        task_state = result.state.lower()
+        
+        if not result.ready():
+            return Response({'task_id': task_id, 'status': task_state, 'success': True})
+        
+        # Deliver the outcome once, then drop it from the result backend
+        parse_result = result.result
+        successful = result.successful()
+        result.forget()
+        cache.delete(owner_key)
+        
+        if not successful or not isinstance(parse_result, dict):
+            logger = logging.getLogger(__name__)
+            logger.error(f"Resume parse task {task_id} failed: {parse_result!r}")
+            return Response(
+                {'task_id': task_id, 'status': task_state, 'error': 'Failed to parse file', 'success': False},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        if not parse_result.get('success', False):
+            return Response(
+                {
+                    'task_id': task_id,
+                    'status': task_state,
+                    'error': f"Failed to parse file: {parse_result.get('error', 'Unknown error')}",
+                    'success': False
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({
+            'task_id': task_id,
+            'status': task_state,
+            'text': parse_result.get('text', ''),
+            'success': True,
+            'metadata': parse_result.get('metadata', {})
+        })
+
     @action(detail=False, methods=['post'], url_path='analyze-resume', permission_classes=[AllowAny])
+    @ai_cache(keys=['resume_text', 'job_desc'])
     def analyze_resume(self, request):
         """
         Analyze a resume for ATS optimization.
@@ -284,7 +440,12 @@ class AIViewSet(viewsets.ViewSet):
                 )
                 analysis = self._add_upsell_message(analysis, user_id)
                 response_serializer = ResumeAnalysisResponseSerializer(analysis)
-                return Response(response_serializer.data, status=status.HTTP_200_OK)
+                # A degraded result: don't let ai_cache keep it for the full TTL
+                return Response(
+                    response_serializer.data,
+                    status=status.HTTP_200_OK,
+                    headers={'Cache-Control': 'no-store'}
+                )
             except Exception as fallback_error:
                 return Response(
                     {'error': f'Analysis failed: {str(e)}'},
@@ -380,6 +541,7 @@ class AIViewSet(viewsets.ViewSet):
         tags=['AI Services']
     )
     @action(detail=False, methods=['post'], url_path='match-job')
+    @ai_cache(keys=['resume_text', 'job_description'])
     def match_job(self, request):
         """
         Match a resume with a job description (keyword-based).
@@ -672,8 +834,7 @@ class AIViewSet(viewsets.ViewSet):
         try:
             # Try to use OpenAI for AI-powered suggestion application
             try:
-                from config.ai.utils import get_openai_client
-                client = get_openai_client()
+                from config.ai.batcher import get_openai_batcher
                 
                 # Build context for AI
                 suggestions_text = '\n'.join([
@@ -701,8 +862,8 @@ Suggestions to Apply:
 
 Return the OPTIMIZED resume text with ALL suggestions applied. Do not add explanations or comments - only return the improved resume text. Maintain all original information while applying improvements."""
 
-                # Call OpenAI API
-                response = client.chat.completions.create(
+                # Call OpenAI API (identical concurrent requests share one completion)
+                optimized_text = get_openai_batcher().complete(
                     model="gpt-3.5-turbo",
                     messages=[
                         {
@@ -716,9 +877,7 @@ Return the OPTIMIZED resume text with ALL suggestions applied. Do not add explan
                     ],
                     max_tokens=2000,
                     temperature=0.7,
-                )
-                
-                optimized_text = response.choices[0].message.content.strip()
+                ).strip()
                 
                 # Clean up response (remove any markdown formatting if present)
                 if '```' in optimized_text:
@@ -770,10 +929,6 @@ Return the OPTIMIZED resume text with ALL suggestions applied. Do not add explan
         missing_keywords: List[str]
     ) -> Response:
         """Fallback rule-based suggestion application."""
-        import re
-        from rest_framework.response import Response
-        from rest_framework import status
-        
         optimized_text = resume_text
         changes_applied = []
         
@@ -781,7 +936,7 @@ Return the OPTIMIZED resume text with ALL suggestions applied. Do not add explan
         if missing_keywords:
             keywords_to_add = missing_keywords[:10]
             # Find or create Skills section
-            skills_match = re.search(r'(skills|technologies|technical skills)[:.\s]*([^\n]*)', optimized_text, re.IGNORECASE)
+            skills_match = _SKILLS_LINE_RE.search(optimized_text)
             if skills_match:
                 existing_skills = skills_match.group(2) or ''
                 new_skills = ', '.join(k.title() for k in keywords_to_add)
@@ -795,31 +950,33 @@ Return the OPTIMIZED resume text with ALL suggestions applied. Do not add explan
             changes_applied.append(f"Added {len(keywords_to_add)} keywords")
         
         # Apply formatting suggestions - convert to bullets
-        bullets_before = len(re.findall(r'[•\-\*]', optimized_text))
         lines = optimized_text.split('\n')
         improved_lines = []
         in_experience = False
+        bullets_added = 0
         
         for line in lines:
             line_stripped = line.strip()
-            if re.match(r'^(experience|work|employment|achievements)', line_stripped, re.IGNORECASE):
-                in_experience = True
-            elif re.match(r'^(education|skills|summary)', line_stripped, re.IGNORECASE):
-                in_experience = False
+            heading = _SECTION_HEADING_RE.match(line_stripped)
+            if heading:
+                in_experience = heading.group(1) is not None
             
             # Convert to bullet if in experience section
-            if in_experience and line_stripped and not line_stripped.startswith(('•', '-', '*')) and len(line_stripped) > 30:
-                action_verbs = ['developed', 'implemented', 'created', 'managed', 'led', 'achieved', 'increased', 'improved']
-                if any(verb in line_stripped.lower() for verb in action_verbs):
-                    improved_lines.append(f"• {line_stripped}")
-                    continue
+            if (
+                in_experience
+                and len(line_stripped) > 30
+                and not line_stripped.startswith(('•', '-', '*'))
+                and _ACTION_VERB_RE.search(line_stripped)
+            ):
+                improved_lines.append(f"• {line_stripped}")
+                bullets_added += 1
+                continue
             
             improved_lines.append(line)
         
         optimized_text = '\n'.join(improved_lines)
-        bullets_after = len(re.findall(r'[•\-\*]', optimized_text))
-        if bullets_after > bullets_before:
-            changes_applied.append(f"Added {bullets_after - bullets_before} bullet points")
+        if bullets_added:
+            changes_applied.append(f"Added {bullets_added} bullet points")
         
         return Response({
             'optimized_text': optimized_text,
@@ -1,13 +1,17 @@
 """
 Resume views for CRUD operations and premium PDF export.
 """
+import hashlib
+import json
 import logging
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema
 from config.services.resume_service import ResumeService
+from config.supabase import get_supabase_user_client
 
 logger = logging.getLogger(__name__)
 from api.serializers.resume import (
@@ -27,10 +31,89 @@ from api.serializers.files import (
 )
 from api.auth.utils import get_supabase_user_id
 from api.permissions import IsResumeOwner
-from config.files.exporter import ResumeExporter
+from api.renderers import ORJSONRenderer
+from config.files.exporter import ResumeExporter, PDF_EXPORT_AVAILABLE
 from config.files.storage import FileStorageService
-from config.services.resume_pdf_generator import PremiumResumePDFGenerator
-from django.template.loader import render_to_string
+from config.services.resume_pdf_generator import get_compiled_template, get_pdf_generator
+from config.services.resume_render_helpers import ResumeRenderData, build_render_context, build_resume_data
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Personal info fields stored on the user profile: (serializer field, profile column)
+_PROFILE_FIELD_MAP = (
+    ('phone', 'phone_number'),
+    ('location', 'location'),
+    ('linkedin_url', 'linkedin_url'),
+    ('github_url', 'github_url'),
+    ('portfolio_url', 'portfolio_url'),
+)
+
+# Resume columns managed by the metadata endpoint
+_METADATA_FIELDS = ('last_template', 'last_font')
+
+
+def _metadata_etag(resume_id, values):
+    """
+    Build an ETag for a resume's metadata (last template/font).
+    
+    Args:
+        resume_id: Resume ID
+        values: Mapping containing the metadata fields
+        
+    Returns:
+        str: Quoted ETag value
+    """
+    digest = hashlib.blake2b(str(resume_id).encode(), digest_size=8)
+    for field in _METADATA_FIELDS:
+        digest.update(b'\0' + (values.get(field) or '').encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _dumps(data):
+    """Serialize data to canonical JSON bytes (sorted keys) for hashing or responses."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, default=str).encode()
+
+
+def _content_etag(body):
+    """Build a weak ETag from serialized response content."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request, etag):
+    """Check whether the request's If-None-Match header covers the given ETag."""
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == '*' or etag in parse_etags(if_none_match)
+
+
+def _if_match_satisfied(request, etag):
+    """
+    Check whether the request's If-Match header allows a write to a resource with this ETag.
+    
+    Accepts ``*``, a list of ETags, and weak forms of the ETag (a compressing
+    proxy may have turned ``"x"`` into ``W/"x"`` on the way to the client).
+    """
+    if_match = request.headers.get('If-Match')
+    if not if_match or if_match.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(tag.removeprefix('W/') == opaque for tag in parse_etags(if_match))
+
+
+# Supported export formats and their content types
+_EXPORTERS = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
 
 
 class ResumeViewSet(viewsets.ViewSet):
@@ -45,9 +128,48 @@ class ResumeViewSet(viewsets.ViewSet):
         if not supabase_user_id:
             return []
         
-        service = ResumeService()
+        service = self._resume_service(self.request)
         return service.get_user_resumes(supabase_user_id)
     
+    def _resume_service(self, request):
+        """
+        Get a ResumeService for the request.
+        
+        With SUPABASE_RLS_ENFORCED, queries run with the caller's JWT so Postgres
+        Row Level Security limits them to the caller's own resumes.
+        """
+        if settings.SUPABASE_RLS_ENFORCED and isinstance(request.auth, str):
+            # One client per request, closed in finalize_response
+            client = getattr(request, '_supabase_user_client', None)
+            if client is None:
+                client = request._supabase_user_client = get_supabase_user_client(request.auth)
+            return ResumeService(client=client)
+        return ResumeService()
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Close the request's RLS client (if one was made) once the view is done."""
+        client = getattr(request, '_supabase_user_client', None)
+        if client is not None:
+            request._supabase_user_client = None
+            client.session.close()
+        return super().finalize_response(request, response, *args, **kwargs)
+    
+    def _owned_update_failed(self, service, pk):
+        """
+        Build the error response for a conditional update that matched no row.
+        
+        Only runs on the miss path, to tell "not found" apart from "not yours".
+        """
+        if not service.exists(pk):
+            return Response(
+                {'error': 'Resume not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(
+            {'error': 'Permission denied'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
     @extend_schema(
         operation_id='list_resumes',
         responses={200: ResumeListSerializer(many=True)},
@@ -66,11 +188,23 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
-        resumes = service.get_user_resumes(supabase_user_id)
+        service = self._resume_service(request)
+        resumes = service.get_user_resume_list(supabase_user_id)
+        
+        body = _dumps(resumes)
+        etag = _content_etag(body)
+        if _etag_matches(request, etag):
+            return HttpResponseNotModified(headers={'ETag': etag})
         
-        serializer = ResumeListSerializer(resumes, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Rows already have the ResumeListSerializer shape; skip DRF serialization
+        # and renderer negotiation on this hot path when orjson is available.
+        if ORJSON_AVAILABLE:
+            response = HttpResponse(body, content_type='application/json')
+        else:
+            serializer = ResumeListSerializer(resumes, many=True)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        return response
     
     @extend_schema(
         operation_id='create_resume',
@@ -94,7 +228,7 @@ class ResumeViewSet(viewsets.ViewSet):
         serializer = ResumeCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        service = ResumeService()
+        service = self._resume_service(request)
         data = serializer.validated_data.copy()
         data['user_id'] = supabase_user_id
         data['status'] = 'draft'
@@ -122,7 +256,7 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
+        service = self._resume_service(request)
         resume = service.get_resume_with_details(pk)
         
         if not resume:
@@ -132,14 +266,18 @@ class ResumeViewSet(viewsets.ViewSet):
             )
         
         # Check ownership
-        if str(resume.get('user_id')) != supabase_user_id:
+        if resume.get('user_id') != supabase_user_id:
             return Response(
                 {'error': 'Permission denied'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
+        etag = _content_etag(_dumps(resume))
+        if _etag_matches(request, etag):
+            return HttpResponseNotModified(headers={'ETag': etag})
+        
         serializer = ResumeDetailSerializer(resume)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.data, status=status.HTTP_200_OK, headers={'ETag': etag})
     
     @extend_schema(
         operation_id='update_resume',
@@ -160,26 +298,14 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
-        resume = service.get_by_id(pk)
-        
-        if not resume:
-            return Response(
-                {'error': 'Resume not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check ownership
-        if str(resume.get('user_id')) != supabase_user_id:
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         serializer = ResumeSerializer(data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         
-        updated_resume = service.update(pk, serializer.validated_data)
+        # Ownership check and write in a single conditional UPDATE
+        service = self._resume_service(request)
+        updated_resume = service.update_if_owned(pk, supabase_user_id, serializer.validated_data)
+        if updated_resume is None:
+            return self._owned_update_failed(service, pk)
         
         response_serializer = ResumeSerializer(updated_resume)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -202,7 +328,7 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
+        service = self._resume_service(request)
         resume = service.get_by_id(pk)
         
         if not resume:
@@ -212,7 +338,7 @@ class ResumeViewSet(viewsets.ViewSet):
             )
         
         # Check ownership
-        if str(resume.get('user_id')) != supabase_user_id:
+        if resume.get('user_id') != supabase_user_id:
             return Response(
                 {'error': 'Permission denied'},
                 status=status.HTTP_403_FORBIDDEN
@@ -241,63 +367,25 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
-        resume = service.get_by_id(pk)
-        
-        if not resume:
-            return Response(
-                {'error': 'Resume not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check ownership
-        if str(resume.get('user_id')) != supabase_user_id:
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         serializer = PersonalInfoSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
         
-        # Update resume with personal info
-        update_data = {}
-        if 'full_name' in serializer.validated_data:
-            update_data['title'] = serializer.validated_data['full_name']
-        
-        # Update user profile with personal info (phone, location, linkedin, github, portfolio)
-        # Note: email is in auth.users, not user_profiles
-        from config.services.user_service import UserProfileService
-        profile_service = UserProfileService()
+        title = validated_data['full_name'] if 'full_name' in validated_data else None
         
+        # Profile fields (phone, location, linkedin, github, portfolio); email is in auth.users.
         # Filter out empty strings and None values before updating profile
-        profile_data = {}
-        if serializer.validated_data.get('phone'):
-            profile_data['phone_number'] = serializer.validated_data['phone']
-        if serializer.validated_data.get('location'):
-            profile_data['location'] = serializer.validated_data['location']
-        if serializer.validated_data.get('linkedin_url'):
-            profile_data['linkedin_url'] = serializer.validated_data['linkedin_url']
-        if serializer.validated_data.get('github_url'):
-            profile_data['github_url'] = serializer.validated_data['github_url']
-        if serializer.validated_data.get('portfolio_url'):
-            profile_data['portfolio_url'] = serializer.validated_data['portfolio_url']
-        
-        # Update or create user profile with available data (only non-empty values)
-        if profile_data:
-            profile_service.create_or_update_profile(
-                user_id=supabase_user_id,
-                phone_number=profile_data.get('phone_number'),
-                location=profile_data.get('location'),
-                linkedin_url=profile_data.get('linkedin_url'),
-                github_url=profile_data.get('github_url'),
-                portfolio_url=profile_data.get('portfolio_url'),
-            )
+        profile_data = {
+            profile_field: validated_data[field]
+            for field, profile_field in _PROFILE_FIELD_MAP
+            if validated_data.get(field)
+        }
         
-        if update_data:
-            updated_resume = service.update(pk, update_data)
-            response_serializer = ResumeSerializer(updated_resume)
-            return Response(response_serializer.data, status=status.HTTP_200_OK)
+        # Title update, ownership check and profile upsert in a single RPC
+        service = self._resume_service(request)
+        resume = service.update_personal_info_atomic(pk, supabase_user_id, title, profile_data)
+        if resume is None:
+            return self._owned_update_failed(service, pk)
         
         return Response(ResumeSerializer(resume).data, status=status.HTTP_200_OK)
     
@@ -327,24 +415,6 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
-        resume = service.get_by_id(pk)
-        
-        if not resume:
-            logger.warning(f"[SUMMARY UPDATE] Resume not found - pk: {pk}")
-            return Response(
-                {'error': 'Resume not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check ownership
-        if str(resume.get('user_id')) != supabase_user_id:
-            logger.warning(f"[SUMMARY UPDATE] Permission denied - pk: {pk}, user_id: {supabase_user_id}")
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         # Accept both old format (professional_tagline/summary) and new format (optimized_summary/summary)
         serializer = OptimizedSummarySerializer(data=request.data)
         if not serializer.is_valid():
@@ -368,7 +438,11 @@ class ResumeViewSet(viewsets.ViewSet):
         }
         
         logger.info(f"[SUMMARY UPDATE] Updating resume - pk: {pk}, summary length: {len(summary_text)}")
-        updated_resume = service.update(pk, update_data)
+        service = self._resume_service(request)
+        updated_resume = service.update_if_owned(pk, supabase_user_id, update_data)
+        if updated_resume is None:
+            logger.warning(f"[SUMMARY UPDATE] Resume not found or permission denied - pk: {pk}, user_id: {supabase_user_id}")
+            return self._owned_update_failed(service, pk)
         response_serializer = ResumeSerializer(updated_resume)
         logger.info(f"[SUMMARY UPDATE] Successfully updated - pk: {pk}")
         return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -397,29 +471,17 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        service = ResumeService()
-        resume = service.get_by_id(pk)
-        
-        if not resume:
-            return Response(
-                {'error': 'Resume not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        if str(resume.get('user_id')) != supabase_user_id:
-            logger.warning(f"[OPTIMIZED SUMMARY UPDATE] Permission denied - pk: {pk}, user_id: {supabase_user_id}")
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         serializer = OptimizedSummarySerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         optimized_summary = serializer.validated_data.get('optimized_summary', '')
         logger.info(f"[OPTIMIZED SUMMARY UPDATE] Updating resume - pk: {pk}, summary length: {len(optimized_summary) if optimized_summary else 0}")
         
-        updated_resume = service.update(pk, {'optimized_summary': optimized_summary})
+        service = self._resume_service(request)
+        updated_resume = service.update_if_owned(pk, supabase_user_id, {'optimized_summary': optimized_summary})
+        if updated_resume is None:
+            logger.warning(f"[OPTIMIZED SUMMARY UPDATE] Resume not found or permission denied - pk: {pk}, user_id: {supabase_user_id}")
+            return self._owned_update_failed(service, pk)
         response_serializer = ResumeSerializer(updated_resume)
         logger.info(f"[OPTIMIZED SUMMARY UPDATE] Successfully updated - pk: {pk}")
         return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -434,6 +496,10 @@ class ResumeViewSet(viewsets.ViewSet):
     def update_metadata(self, request, pk=None):
         """
         Update resume metadata such as last selected template/font.
+        
+        Responses carry an ETag for the stored metadata. With If-Match the write
+        only applies while the stored metadata still has that ETag; otherwise
+        the response is 412 and the client should reload before saving again.
         """
         supabase_user_id = get_supabase_user_id(request)
         if not supabase_user_id:
@@ -442,36 +508,71 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        service = ResumeService()
-        resume = service.get_by_id(pk)
+        serializer = ResumeMetadataSerializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
 
-        if not resume:
-            return Response(
-                {'error': 'Resume not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        update_data = {
+            field: serializer.validated_data[field]
+            for field in _METADATA_FIELDS
+            if field in serializer.validated_data
+        }
 
-        if str(resume.get('user_id')) != supabase_user_id:
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        service = self._resume_service(request)
+        if_match = request.headers.get('If-Match')
+        if not update_data or if_match:
+            resume = service.get_by_id(pk)
 
-        serializer = ResumeMetadataSerializer(data=request.data, partial=True)
-        serializer.is_valid(raise_exception=True)
+            if not resume:
+                return Response(
+                    {'error': 'Resume not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
-        update_data = {}
-        if 'last_template' in serializer.validated_data:
-            update_data['last_template'] = serializer.validated_data['last_template']
-        if 'last_font' in serializer.validated_data:
-            update_data['last_font'] = serializer.validated_data['last_font']
+            if resume.get('user_id') != supabase_user_id:
+                return Response(
+                    {'error': 'Permission denied'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+
+            etag = _metadata_etag(pk, resume)
+            if not _if_match_satisfied(request, etag):
+                return Response(
+                    {'error': 'Resume metadata has changed since it was loaded'},
+                    status=status.HTTP_412_PRECONDITION_FAILED,
+                    headers={'ETag': etag}
+                )
 
-        if not update_data:
-            return Response(ResumeSerializer(resume).data, status=status.HTTP_200_OK)
+            # Auto-saves often resend the stored values; those need no write
+            if all(resume.get(field) == value for field, value in update_data.items()):
+                return Response(
+                    ResumeSerializer(resume).data,
+                    status=status.HTTP_200_OK,
+                    headers={'ETag': etag}
+                )
 
-        updated_resume = service.update(pk, update_data)
+            # Write only while the stored metadata is still the state the ETag described
+            updated_resume = service.update_if_owned(
+                pk,
+                supabase_user_id,
+                update_data,
+                expected={field: resume.get(field) for field in _METADATA_FIELDS}
+            )
+            if updated_resume is None:
+                return Response(
+                    {'error': 'Resume metadata has changed since it was loaded'},
+                    status=status.HTTP_412_PRECONDITION_FAILED
+                )
+        else:
+            # Ownership check and write in a single conditional UPDATE
+            updated_resume = service.update_if_owned(pk, supabase_user_id, update_data)
+            if updated_resume is None:
+                return self._owned_update_failed(service, pk)
         response_serializer = ResumeSerializer(updated_resume)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return Response(
+            response_serializer.data,
+            status=status.HTTP_200_OK,
+            headers={'ETag': _metadata_etag(pk, updated_resume)}
+        )
     
     @extend_schema(
         operation_id='export_resume',
@@ -502,23 +603,6 @@ class ResumeViewSet(viewsets.ViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        # Get resume with ALL related data
-        service = ResumeService()
-        resume = service.get_resume_with_details(pk)
-        
-        if not resume:
-            return Response(
-                {'error': 'Resume not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check ownership
-        if str(resume.get('user_id')) != str(supabase_user_id):
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         # Handle parameters based on request method
         params = {}
         if request.method == 'POST':
@@ -537,6 +621,36 @@ class ResumeViewSet(viewsets.ViewSet):
             }
         
         export_format = params.get('format', 'pdf')
+        if export_format not in _EXPORTERS:
+            return Response(
+                {'error': f'Unsupported format: {export_format}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Capability is probed once at import time; fail before any database work
+        if export_format == 'pdf' and not PDF_EXPORT_AVAILABLE:
+            return Response(
+                {'error': 'Export functionality not available: PDF export requires WeasyPrint or reportlab'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        # Get resume with ALL related data
+        service = self._resume_service(request)
+        resume = service.get_resume_with_details(pk)
+        
+        if not resume:
+            return Response(
+                {'error': 'Resume not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        # Check ownership
+        if resume.get('user_id') != supabase_user_id:
+            return Response(
+                {'error': 'Permission denied'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
         template_name = params.get('template') or resume.get('last_template') or 'modern-indigo'
         font_combination = params.get('font') or resume.get('last_font') or 'modern'
         ats_mode = params.get('ats_mode', False)
@@ -555,100 +669,32 @@ class ResumeViewSet(viewsets.ViewSet):
             f"summary_length: {len(resume.get('summary', ''))}"
         )
         
-        # Extract personal_info if it's stored as a JSON field
-        personal_info = {}
-        if isinstance(resume.get('personal_info'), dict):
-            personal_info = resume.get('personal_info', {})
-        else:
-            # If personal_info is stored as separate fields, construct it
-            personal_info = {
-                'full_name': resume.get('full_name', ''),
-                'email': resume.get('email', ''),
-                'phone': resume.get('phone', ''),
-                'location': resume.get('location', ''),
-                'linkedin_url': resume.get('linkedin_url', ''),
-                'github_url': resume.get('github_url', ''),
-                'portfolio_url': resume.get('portfolio_url', ''),
-            }
-        
-        # Prepare COMPLETE resume data for PDF generation - NO DATA STRIPPING
-        resume_data = {
-            'id': str(resume.get('id', '')),
-            'full_name': personal_info.get('full_name') or resume.get('title', '') or resume.get('full_name', 'Your Name'),
-            'title': resume.get('title', ''),  # This is the name field in DB
-            'professional_tagline': resume.get('professional_tagline', ''),
-            'summary': resume.get('summary', ''),
-            'optimized_summary': resume.get('optimized_summary', ''),
-            'email': personal_info.get('email') or resume.get('email', ''),
-            'phone': personal_info.get('phone') or resume.get('phone', ''),
-            'location': personal_info.get('location') or resume.get('location', ''),
-            'linkedin_url': personal_info.get('linkedin_url') or resume.get('linkedin_url', ''),
-            'github_url': personal_info.get('github_url') or resume.get('github_url', ''),
-            'portfolio_url': personal_info.get('portfolio_url') or resume.get('portfolio_url', ''),
-            'personal_info': personal_info,
-            # Pass ALL data - ensure lists are never None
-            'experiences': resume.get('experiences') or [],
-            'educations': resume.get('educations') or [],
-            'skills': resume.get('skills') or [],
-            'projects': resume.get('projects') or [],
-            'certifications': resume.get('certifications') or [],
-            'languages': resume.get('languages') or [],
-            'interests': resume.get('interests') or [],
-        }
-        
-        # Log final data being sent to generator
-        logger.info(
-            f"Resume data prepared for PDF - "
-            f"full_name: '{resume_data['full_name']}', "
-            f"title: '{resume_data['title']}', "
-            f"professional_tagline: '{resume_data['professional_tagline']}', "
-            f"experiences: {len(resume_data['experiences'])}, "
-            f"projects: {len(resume_data['projects'])}, "
-            f"skills: {len(resume_data['skills'])}, "
-            f"educations: {len(resume_data['educations'])}, "
-            f"certifications: {len(resume_data['certifications'])}"
-        )
+        content_type = _EXPORTERS[export_format]
+        filename = f"resume_{pk}.{export_format}"
         
         try:
             # Export resume
             exporter = ResumeExporter()
             
             if export_format == 'pdf':
+                # Only PDF needs the template data; DOCX works from the raw resume
                 file_content = exporter.export_to_pdf(
-                    resume_data,
+                    build_resume_data(resume),
                     template_name=template_name,
                     font_combination=font_combination,
                     ats_mode=ats_mode,
                     photo_url=photo_url
                 )
-                content_type = 'application/pdf'
-                filename = f"resume_{pk}.pdf"
-            elif export_format == 'docx':
-                file_content = exporter.export_to_docx(resume, template_name)
-                content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-                filename = f"resume_{pk}.docx"
             else:
-                return Response(
-                    {'error': f'Unsupported format: {export_format}'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+                file_content = exporter.export_to_docx(resume, template_name)
             
             # Return file directly for download
-            from django.http import HttpResponse
-            
             response = HttpResponse(file_content, content_type=content_type)
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
             response['Content-Length'] = len(file_content)
             
             return response
         
-        except ImportError as e:
-            logger.error(f"Missing dependency for export: {e}")
-            return Response(
-                {'error': f'Export functionality not available: {str(e)}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        
         except Exception as e:
             logger.exception("Error exporting resume")
             return Response(
@@ -661,11 +707,12 @@ class ResumeViewSet(viewsets.ViewSet):
         tags=['Debug'],
         description='Debug endpoint to get raw HTML being sent to WeasyPrint'
     )
-    @action(detail=True, methods=['post'], url_path='debug/pdf-html')
+    @action(detail=True, methods=['post'], url_path='debug/pdf-html', renderer_classes=[ORJSONRenderer])
     def debug_pdf_html(self, request, pk=None):
         """
         Debug endpoint: Returns the raw HTML string being sent to WeasyPrint.
         POST /api/v1/resumes/{id}/debug/pdf-html/
+        POST /api/v1/resumes/{id}/debug/pdf-html/?output=raw  (HTML body instead of JSON)
         """
         supabase_user_id = get_supabase_user_id(request)
         if not supabase_user_id:
@@ -675,7 +722,7 @@ class ResumeViewSet(viewsets.ViewSet):
             )
         
         # Get resume with ALL related data
-        service = ResumeService()
+        service = self._resume_service(request)
         resume = service.get_resume_with_details(pk)
         
         if not resume:
@@ -685,7 +732,7 @@ class ResumeViewSet(viewsets.ViewSet):
             )
         
         # Check ownership
-        if str(resume.get('user_id')) != str(supabase_user_id):
+        if resume.get('user_id') != supabase_user_id:
             return Response(
                 {'error': 'Permission denied'},
                 status=status.HTTP_403_FORBIDDEN
@@ -698,84 +745,37 @@ class ResumeViewSet(viewsets.ViewSet):
         photo_url = request.data.get('photo_url')
         
         # Prepare resume data (same as export endpoint)
-        personal_info = {}
-        if isinstance(resume.get('personal_info'), dict):
-            personal_info = resume.get('personal_info', {})
-        else:
-            personal_info = {
-                'full_name': resume.get('full_name', ''),
-                'email': resume.get('email', ''),
-                'phone': resume.get('phone', ''),
-                'location': resume.get('location', ''),
-                'linkedin_url': resume.get('linkedin_url', ''),
-                'github_url': resume.get('github_url', ''),
-                'portfolio_url': resume.get('portfolio_url', ''),
-            }
-        
-        resume_data = {
-            'id': str(resume.get('id', '')),
-            'full_name': personal_info.get('full_name') or resume.get('title', '') or resume.get('full_name', 'Your Name'),
-            'title': resume.get('title', ''),
-            'professional_tagline': resume.get('professional_tagline', ''),
-            'summary': resume.get('summary', ''),
-            'optimized_summary': resume.get('optimized_summary', ''),
-            'email': personal_info.get('email') or resume.get('email', ''),
-            'phone': personal_info.get('phone') or resume.get('phone', ''),
-            'location': personal_info.get('location') or resume.get('location', ''),
-            'linkedin_url': personal_info.get('linkedin_url') or resume.get('linkedin_url', ''),
-            'github_url': personal_info.get('github_url') or resume.get('github_url', ''),
-            'portfolio_url': personal_info.get('portfolio_url') or resume.get('portfolio_url', ''),
-            'personal_info': personal_info,
-            'experiences': resume.get('experiences') or [],
-            'educations': resume.get('educations') or [],
-            'skills': resume.get('skills') or [],
-            'projects': resume.get('projects') or [],
-            'certifications': resume.get('certifications') or [],
-            'languages': resume.get('languages') or [],
-            'interests': resume.get('interests') or [],
-        }
+        resume_data = ResumeRenderData.from_resume(resume)
         
         try:
             # Generate HTML using the same method as PDF generation
-            generator = PremiumResumePDFGenerator()
-            fonts = generator.FONT_COMBINATIONS.get(font_combination, generator.FONT_COMBINATIONS['modern'])
-            context = generator._prepare_context(resume_data, template_name, fonts, ats_mode, None, photo_url)
-            
-            # Generate QR codes
-            linkedin_url = resume_data.get('linkedin_url') or resume_data.get('user_profile', {}).get('linkedin_url', '')
-            portfolio_url = resume_data.get('portfolio_url') or resume_data.get('user_profile', {}).get('portfolio_url', '')
-            if linkedin_url or portfolio_url:
-                qr_code_data = generator._generate_qr_code(linkedin_url or portfolio_url)
-                if qr_code_data:
-                    context['qr_code'] = qr_code_data
+            generator = get_pdf_generator()
+            context = build_render_context(
+                generator, resume_data, template_name, font_combination, ats_mode, photo_url
+            )
             
-            resume_id = str(resume_data.get('id', ''))
-            portfolio_view_url = f"https://resumeai.pro/view/{resume_id}" if resume_id else (portfolio_url or linkedin_url)
-            if portfolio_view_url:
-                qr_code_footer_data = generator._generate_qr_code(portfolio_view_url)
-                if qr_code_footer_data:
-                    context['qr_code_footer'] = qr_code_footer_data
-                    context['portfolio_view_url'] = portfolio_view_url
+            # Render HTML with the per-process compiled template
+            html_content = get_compiled_template(template_name).render(context)
             
-            # Render HTML
-            template_path = f'resumes/{template_name}.html'
-            html_content = render_to_string(template_path, context)
+            # Raw mode sends the HTML as-is, skipping the JSON encoding/escaping pass
+            if request.query_params.get('output') == 'raw':
+                return HttpResponse(html_content, content_type='text/html; charset=utf-8')
             
             return Response({
                 'html': html_content,
                 'html_length': len(html_content),
                 'template': template_name,
                 'data_summary': {
-                    'full_name': resume_data['full_name'],
-                    'title': resume_data['title'],
-                    'professional_tagline': resume_data['professional_tagline'],
-                    'experiences_count': len(resume_data['experiences']),
-                    'projects_count': len(resume_data['projects']),
-                    'skills_count': len(resume_data['skills']),
-                    'educations_count': len(resume_data['educations']),
-                    'certifications_count': len(resume_data['certifications']),
-                    'languages_count': len(resume_data['languages']),
-                    'summary_length': len(resume_data.get('summary', '')),
+                    'full_name': resume_data.full_name,
+                    'title': resume_data.title,
+                    'professional_tagline': resume_data.professional_tagline,
+                    'experiences_count': len(resume_data.experiences),
+                    'projects_count': len(resume_data.projects),
+                    'skills_count': len(resume_data.skills),
+                    'educations_count': len(resume_data.educations),
+                    'certifications_count': len(resume_data.certifications),
+                    'languages_count': len(resume_data.languages),
+                    'summary_length': len(resume_data.summary),
                 }
             }, status=status.HTTP_200_OK)
         
@@ -1,28 +1,156 @@
 """
 Template views for serving template previews and metadata.
 """
+import json
 import os
 import logging
 from pathlib import Path
+from typing import Optional
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema
 from django.conf import settings
-from django.http import FileResponse, Http404
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 
 logger = logging.getLogger(__name__)
 
 
+def _file_response(request, path: Path, content_type: str, filename: str, as_attachment: bool = False):
+    """
+    Build a conditional response serving a file under MEDIA_ROOT.
+    
+    The ETag is derived from the file's mtime and size; a matching
+    If-None-Match gets 304 Not Modified without touching the file contents.
+    With SENDFILE_HEADER configured, the front web server sends the file
+    (sendfile, no Python copy); otherwise Django streams it via FileResponse.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        path: File path under MEDIA_ROOT
+        content_type: MIME type of the file
+        filename: Filename for Content-Disposition
+        as_attachment: Whether to serve as a download rather than inline
+        
+    Returns:
+        HttpResponse, FileResponse or HttpResponseNotModified
+    """
+    stat_result = path.stat()
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match and (if_none_match.strip() == '*' or etag in parse_etags(if_none_match)):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        return response
+    
+    header = settings.SENDFILE_HEADER
+    if not header:
+        # FileResponse owns the handle (closed with the response) and is passed to
+        # the server's wsgi.file_wrapper, which gunicorn serves with sendfile(2)
+        response = FileResponse(
+            path.open('rb'),
+            content_type=content_type,
+            filename=filename,
+            as_attachment=as_attachment
+        )
+    else:
+        if header == 'X-Accel-Redirect':
+            relative_path = path.relative_to(settings.MEDIA_ROOT).as_posix()
+            location = f"{settings.SENDFILE_URL_PREFIX.rstrip('/')}/{relative_path}"
+        else:
+            location = str(path)
+        
+        response = HttpResponse(content_type=content_type)
+        response[header] = location
+        disposition = 'attachment' if as_attachment else 'inline'
+        response['Content-Disposition'] = f'{disposition}; filename="{filename}"'
+    
+    response['ETag'] = etag
+    return response
+
+
+# Thumbnail locations under MEDIA_ROOT/templates as (directory, filename pattern),
+# in order of preference
+_THUMBNAIL_CANDIDATES = (
+    ('thumbnails', '{}-thumb.webp'),
+    ('thumbnails', '{}-thumb.png'),
+    ('previews', '{}-thumb.png'),
+    ('previews', '{}_thumb.png'),
+    ('thumbnails', '{}_thumb.png'),
+)
+
+# Template ID -> thumbnail path, built from one directory listing per location
+_thumbnail_index = None
+# Directory mtimes the index was built from; a change means files were added or removed
+_thumbnail_dir_mtimes = None
+
+
+def _thumbnail_dir_mtimes_now() -> tuple:
+    """Stat the thumbnail directories (None for a missing directory)."""
+    templates_dir = Path(settings.MEDIA_ROOT) / 'templates'
+    mtimes = []
+    for directory in dict.fromkeys(directory for directory, _ in _THUMBNAIL_CANDIDATES):
+        try:
+            mtimes.append((templates_dir / directory).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _build_thumbnail_index(template_ids) -> dict:
+    """Scan the thumbnail directories once and map each template ID to its preferred file."""
+    templates_dir = Path(settings.MEDIA_ROOT) / 'templates'
+    listings = {}
+    for directory, _ in _THUMBNAIL_CANDIDATES:
+        if directory not in listings:
+            try:
+                listings[directory] = set(os.listdir(templates_dir / directory))
+            except FileNotFoundError:
+                listings[directory] = set()
+    
+    index = {}
+    for template_id in template_ids:
+        for directory, pattern in _THUMBNAIL_CANDIDATES:
+            filename = pattern.format(template_id)
+            if filename in listings[directory]:
+                index[template_id] = templates_dir / directory / filename
+                break
+    return index
+
+
+def _find_thumbnail(template_id: str, template_ids) -> Optional[Path]:
+    """
+    Look up the thumbnail path for a template.
+    
+    Each call stats the thumbnail directories; the index is rebuilt when
+    their mtimes change (a thumbnail was generated, renamed or removed) or
+    on a miss, so newly generated thumbnails are picked up without a restart.
+    """
+    global _thumbnail_index, _thumbnail_dir_mtimes
+    mtimes = _thumbnail_dir_mtimes_now()
+    if _thumbnail_index is None or mtimes != _thumbnail_dir_mtimes or template_id not in _thumbnail_index:
+        _thumbnail_index = _build_thumbnail_index(template_ids)
+        _thumbnail_dir_mtimes = mtimes
+    return _thumbnail_index.get(template_id)
+
+
+def _invalidate_thumbnail_index() -> None:
+    """Drop the thumbnail index, e.g. after an indexed file has disappeared."""
+    global _thumbnail_index
+    _thumbnail_index = None
+
+
 class TemplateViewSet(viewsets.ViewSet):
     """
     ViewSet for serving template previews and metadata.
     """
     permission_classes = [AllowAny]  # Templates are public
     
-    # Available templates (should match frontend/lib/templates.ts)
-    TEMPLATE_IDS = [
+    # Available templates in display order (should match frontend/lib/templates.ts)
+    TEMPLATE_ORDER = (
         'modern-indigo',
         'minimalist-black',
         'creative-violet',
@@ -31,7 +159,20 @@ class TemplateViewSet(viewsets.ViewSet):
         'sidebar-teal',
         'ats-classic',
         'elegant-emerald',
+    )
+    # Set for O(1) membership checks on each request
+    TEMPLATE_IDS = frozenset(TEMPLATE_ORDER)
+    # Static list() response, built once at import time
+    TEMPLATES_PAYLOAD = [
+        {
+            'id': template_id,
+            'preview_url': f'/api/v1/templates/{template_id}/preview/',
+            'thumbnail_url': f'/api/v1/templates/{template_id}/thumbnail/',
+        }
+        for template_id in TEMPLATE_ORDER
     ]
+    # Pre-serialized list() body; served without DRF renderer negotiation
+    TEMPLATES_JSON = json.dumps(TEMPLATES_PAYLOAD, separators=(',', ':')).encode()
     
     @extend_schema(
         operation_id='list_templates',
@@ -44,16 +185,7 @@ class TemplateViewSet(viewsets.ViewSet):
         
         GET /api/v1/templates/
         """
-        templates = []
-        for template_id in self.TEMPLATE_IDS:
-            template = {
-                'id': template_id,
-                'preview_url': f'/api/v1/templates/{template_id}/preview/',
-                'thumbnail_url': f'/api/v1/templates/{template_id}/thumbnail/',
-            }
-            templates.append(template)
-        
-        return Response(templates, status=status.HTTP_200_OK)
+        return HttpResponse(self.TEMPLATES_JSON, content_type='application/json')
     
     @extend_schema(
         operation_id='get_template_preview',
@@ -94,8 +226,9 @@ class TemplateViewSet(viewsets.ViewSet):
                 )
         
         try:
-            return FileResponse(
-                open(preview_path, 'rb'),
+            return _file_response(
+                request,
+                preview_path,
                 content_type='application/pdf',
                 filename=f'{template_id}_preview.pdf'
             )
@@ -108,7 +241,7 @@ class TemplateViewSet(viewsets.ViewSet):
     
     @extend_schema(
         operation_id='get_template_thumbnail',
-        responses={200: {'content': {'image/png': {}}}},
+        responses={200: {'content': {'image/webp': {}, 'image/png': {}}}},
         tags=['Templates']
     )
     @action(detail=True, methods=['get'], url_path='thumbnail')
@@ -117,6 +250,7 @@ class TemplateViewSet(viewsets.ViewSet):
         Get thumbnail image of a template.
         
         GET /api/v1/templates/{template_id}/thumbnail/
+        GET /api/v1/templates/{template_id}/thumbnail/?scale=2 (HiDPI variant, when generated)
         
         Returns a thumbnail image for the template.
         """
@@ -128,66 +262,50 @@ class TemplateViewSet(viewsets.ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Look for PNG thumbnail in multiple possible locations
-        media_root = Path(settings.MEDIA_ROOT)
-        
-        # List of possible thumbnail paths (in order of preference)
-        possible_paths = [
-            # Primary location: thumbnails directory with standard naming
-            media_root / 'templates' / 'thumbnails' / f'{template_id}-thumb.png',
-            # Alternative: previews directory with standard naming
-            media_root / 'templates' / 'previews' / f'{template_id}-thumb.png',
-            # Alternative: previews directory with underscore naming
-            media_root / 'templates' / 'previews' / f'{template_id}_thumb.png',
-            # Alternative: thumbnails directory with underscore naming
-            media_root / 'templates' / 'thumbnails' / f'{template_id}_thumb.png',
-        ]
-        
-        thumbnail_path = None
-        for path in possible_paths:
-            if path.exists():
-                thumbnail_path = path
-                logger.debug(f"Found thumbnail at: {thumbnail_path}")
-                break
+        thumbnail_path = _find_thumbnail(template_id, self.TEMPLATE_ORDER)
         
         if not thumbnail_path:
-            # Log all checked paths for debugging
             logger.warning(
                 f"Thumbnail not found for template '{template_id}'. "
-                f"Checked paths: {[str(p) for p in possible_paths]}"
+                f"Checked: {[f'templates/{d}/{p.format(template_id)}' for d, p in _THUMBNAIL_CANDIDATES]}"
             )
             return Response(
                 {'error': f'Thumbnail not found for template: {template_id}'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
+        # Prefer the double-resolution variant when asked for and present
+        if request.query_params.get('scale') == '2':
+            thumbnail_2x_path = thumbnail_path.with_name(f'{template_id}-thumb@2x.webp')
+            if thumbnail_2x_path.exists():
+                thumbnail_path = thumbnail_2x_path
+        
+        # Generated thumbnails are WebP; older PNG thumbnails are still served as-is
+        extension = thumbnail_path.suffix.lstrip('.')
+        filename = f'{template_id}_thumbnail.{extension}'
+        
         try:
-            # Verify file exists and is readable
-            if not thumbnail_path.is_file():
-                logger.error(f"Thumbnail path is not a file: {thumbnail_path}")
-                return Response(
-                    {'error': 'Thumbnail file not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            # Use FileResponse with as_attachment=False to serve inline
-            response = FileResponse(
-                open(thumbnail_path, 'rb'),
-                content_type='image/png',
-                filename=f'{template_id}_thumbnail.png',
+            # Serve inline (via the web server when SENDFILE_HEADER is set)
+            response = _file_response(
+                request,
+                thumbnail_path,
+                content_type=f'image/{extension}',
+                filename=filename,
                 as_attachment=False
             )
             # Add cache headers for better performance
             response['Cache-Control'] = 'public, max-age=31536000'  # 1 year
-            response['Content-Disposition'] = f'inline; filename="{template_id}_thumbnail.png"'
+            response['Content-Disposition'] = f'inline; filename="{filename}"'
             # Add CORS headers to allow cross-origin requests
             response['Access-Control-Allow-Origin'] = '*'
             response['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
             response['Access-Control-Allow-Headers'] = 'Content-Type'
-            logger.info(f"Serving thumbnail: {thumbnail_path} (size: {thumbnail_path.stat().st_size} bytes)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Serving thumbnail: {thumbnail_path} (size: {thumbnail_path.stat().st_size} bytes)")
             return response
         except FileNotFoundError:
             logger.error(f"Thumbnail file not found: {thumbnail_path}")
+            _invalidate_thumbnail_index()
             return Response(
                 {'error': 'Thumbnail file not found'},
                 status=status.HTTP_404_NOT_FOUND
@@ -0,0 +1,104 @@
+"""
+Coalescing of concurrent, identical OpenAI chat completions.
+"""
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from config.ai.utils import get_openai_client
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAIBatcher:
+    """
+    Share one chat completion between concurrent callers sending the same request.
+
+    The UI can submit the same resume and suggestions several times while a
+    slow completion is still running (double clicks, retries, several tabs).
+    The first caller makes the API call; callers with an identical request
+    that arrive before it returns wait for that call's result instead of
+    paying for their own. Results are not kept after the call finishes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    @staticmethod
+    def _request_key(model: str, messages: List[Dict[str, str]], max_tokens: int, temperature: float) -> str:
+        payload = json.dumps([model, messages, max_tokens, temperature], sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-3.5-turbo",
+        max_tokens: int = 2000,
+        temperature: float = 0.7
+    ) -> str:
+        """
+        Get the text of a chat completion, sharing identical in-flight requests.
+
+        Args:
+            messages: Chat messages
+            model: Model name
+            max_tokens: Completion token limit
+            temperature: Sampling temperature
+
+        Returns:
+            str: Content of the first choice
+
+        Raises:
+            ValueError: If OpenAI API key is not configured
+        """
+        key = self._request_key(model, messages, max_tokens, temperature)
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            logger.debug(f"Joining in-flight OpenAI completion {key}")
+            return future.result()
+
+        try:
+            response = get_openai_client().chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            content = response.choices[0].message.content
+            future.set_result(content)
+            return content
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+_batcher: Optional[OpenAIBatcher] = None
+_init_lock = threading.Lock()
+
+
+def get_openai_batcher() -> OpenAIBatcher:
+    """
+    Get the process-wide OpenAIBatcher (created on first use).
+
+    Returns:
+        OpenAIBatcher: Shared batcher
+    """
+    global _batcher
+    if _batcher is None:
+        with _init_lock:
+            if _batcher is None:
+                _batcher = OpenAIBatcher()
+    return _batcher
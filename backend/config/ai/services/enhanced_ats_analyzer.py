@@ -8,6 +8,8 @@ optimized_summary, certifications, projects, etc.
 import re
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Set
 from collections import Counter
 from langchain_openai import ChatOpenAI
@@ -36,6 +38,27 @@ except ImportError:
     ChatOpenAI = None
     ChatPromptTemplate = None
 
+# Threads for job keyword extraction, which waits on the OpenAI API while the
+# request thread scores the resume itself
+_LLM_WORKERS = 8
+_llm_executor: Optional[ThreadPoolExecutor] = None
+_init_lock = threading.Lock()
+
+
+def _get_llm_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor for LLM calls (created on first use, after any fork).
+    
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _llm_executor
+    if _llm_executor is None:
+        with _init_lock:
+            if _llm_executor is None:
+                _llm_executor = ThreadPoolExecutor(max_workers=_LLM_WORKERS, thread_name_prefix='ats-llm')
+    return _llm_executor
+
 
 class EnhancedATSAnalyzerService:
     """Enhanced service for analyzing resumes with LangChain and transparent scoring."""
@@ -70,14 +93,33 @@ class EnhancedATSAnalyzerService:
         if not resume_text:
             raise ValueError("Either resume_data or resume_text must be provided")
         
-        # Extract keywords from job description using LangChain
+        # Extract keywords from job description using LangChain. The LLM round trip
+        # runs on a worker thread while the resume-only scores below are computed.
         job_keywords: Set[str] = set()
+        job_keywords_future = None
         if job_desc:
-            job_keywords = self._extract_job_keywords_langchain(job_desc)
+            if self.llm and LANGCHAIN_AVAILABLE:
+                job_keywords_future = _get_llm_executor().submit(self._extract_job_keywords_langchain, job_desc)
+            else:
+                job_keywords = self._extract_keywords_regex(job_desc)
         
         # Extract resume keywords from ALL fields (text + full structured data)
         resume_keywords = self._extract_resume_keywords_comprehensive(resume_text, resume_data)
         
+        # Calculate readability score using NLTK/textstat Flesch-Kincaid
+        readability_score = self._calculate_readability_score(resume_text)
+        
+        # Calculate quantifiable achievements score (% of bullets with numbers/metrics)
+        quantifiable_score = self._calculate_quantifiable_score(resume_text, resume_data)
+        
+        # Calculate bullet strength (% of bullets starting with action verbs)
+        bullet_strength = self._calculate_bullet_strength(resume_text, resume_data)
+        
+        formatting_score = self._calculate_formatting_score(resume_text, resume_data)
+        
+        if job_keywords_future is not None:
+            job_keywords = job_keywords_future.result()
+        
         # Calculate ATS score with fuzzy matching: (matched_keywords / total_job_keywords) * 100
         ats_score, matched_keywords = self._calculate_ats_score_fuzzy(job_keywords, resume_keywords)
         
@@ -90,15 +132,6 @@ class EnhancedATSAnalyzerService:
             reverse=True
         )[:15]
         
-        # Calculate readability score using NLTK/textstat Flesch-Kincaid
-        readability_score = self._calculate_readability_score(resume_text)
-        
-        # Calculate quantifiable achievements score (% of bullets with numbers/metrics)
-        quantifiable_score = self._calculate_quantifiable_score(resume_text, resume_data)
-        
-        # Calculate bullet strength (% of bullets starting with action verbs)
-        bullet_strength = self._calculate_bullet_strength(resume_text, resume_data)
-        
         # Calculate keyword score (if job_desc provided)
         keyword_score = None
         if job_desc:
@@ -124,7 +157,7 @@ class EnhancedATSAnalyzerService:
             'bullet_strength': bullet_strength,
             'quantifiable_achievements': quantifiable_score,
             'keyword_score': keyword_score,
-            'formatting_score': self._calculate_formatting_score(resume_text, resume_data),
+            'formatting_score': formatting_score,
             'detailed_analysis': {
                 'total_words': len(resume_text.split()),
                 'total_job_keywords': len(job_keywords),
@@ -7,8 +7,8 @@ avoiding hallucinations and maintaining data integrity.
 import json
 import logging
 from typing import Dict, Any, List, Optional
-from openai import OpenAI
 from django.conf import settings
+from config.ai.utils import get_openai_client
 from config.services.resume_service import (
     ResumeService,
     ExperienceService,
@@ -34,7 +34,7 @@ class SuggestionApplierService:
         
         try:
             if settings.OPENAI_API_KEY:
-                self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+                self.openai_client = get_openai_client()
         except Exception as e:
             logger.warning(f"OpenAI not available: {e}")
     
@@ -3,15 +3,38 @@ Utilities for AI services.
 """
 import os
 import re
+from functools import lru_cache
 from typing import Optional, List
 from collections import Counter
-from openai import OpenAI
+import httpx
+from openai import OpenAI, DefaultHttpxClient
 from django.conf import settings
 
+# HTTP/2 needs the optional h2 package; without it the pool speaks HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool for OpenAI API calls. Idle connections are kept for a minute so
+# requests under sustained load skip the TCP/TLS handshake.
+_OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+
+
+@lru_cache(maxsize=1)
+def _build_openai_client(api_key: str) -> OpenAI:
+    """Create the OpenAI client for an API key (cached, so its connection pool is reused)."""
+    http_client = DefaultHttpxClient(
+        http2=HTTP2_AVAILABLE,
+        limits=_OPENAI_HTTP_LIMITS,
+    )
+    return OpenAI(api_key=api_key, http_client=http_client)
+
 
 def get_openai_client() -> OpenAI:
     """
-    Get OpenAI client instance.
+    Get the shared OpenAI client instance.
     
     Returns:
         OpenAI: Configured OpenAI client
@@ -26,7 +49,7 @@ def get_openai_client() -> OpenAI:
             "Set OPENAI_API_KEY in your .env file."
         )
     
-    return OpenAI(api_key=api_key)
+    return _build_openai_client(api_key)
 
 
 def extract_text_from_resume_data(resume_data: dict) -> str:
@@ -15,10 +15,11 @@ logger = logging.getLogger(__name__)
 
 # Try to import the premium PDF generator
 try:
-    from config.services.resume_pdf_generator import PremiumResumePDFGenerator
+    from config.services.resume_pdf_generator import get_pdf_generator, WEASYPRINT_AVAILABLE
     PREMIUM_GENERATOR_AVAILABLE = True
 except ImportError:
     PREMIUM_GENERATOR_AVAILABLE = False
+    WEASYPRINT_AVAILABLE = False
     logger.warning("Premium PDF generator not available. Using fallback.")
 
 # Try to import reportlab for fallback
@@ -31,6 +32,10 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+# Premium PDFs need the generator plus WeasyPrint; reportlab is the fallback
+PREMIUM_PDF_AVAILABLE = PREMIUM_GENERATOR_AVAILABLE and WEASYPRINT_AVAILABLE
+PDF_EXPORT_AVAILABLE = PREMIUM_PDF_AVAILABLE or REPORTLAB_AVAILABLE
+
 
 class ResumeExporter:
     """
@@ -43,7 +48,7 @@ class ResumeExporter:
         
         if PREMIUM_GENERATOR_AVAILABLE:
             try:
-                self.premium_generator = PremiumResumePDFGenerator()
+                self.premium_generator = get_pdf_generator()
                 logger.info("Premium PDF generator initialized")
             except Exception as e:
                 logger.warning(f"Could not initialize premium PDF generator: {e}")
@@ -72,7 +77,7 @@ class ResumeExporter:
             PDF file content as bytes
         """
         # Try premium generator first
-        if self.premium_generator:
+        if self.premium_generator and PREMIUM_PDF_AVAILABLE:
             try:
                 pdf_bytes, _ = self.premium_generator.generate_pdf(
                     resume_data=resume_data,
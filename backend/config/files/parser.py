@@ -3,13 +3,38 @@ Resume file parser for extracting text and data from PDF and DOCX files.
 """
 import logging
 import io
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO, Union
 from pypdf import PdfReader
 from docx import Document
 from docx.opc.exceptions import PackageNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# File contents as bytes, a filesystem path, or a seekable binary file object
+FileSource = Union[bytes, str, BinaryIO]
+
+
+def _as_stream(source: FileSource) -> Union[str, BinaryIO]:
+    """Wrap bytes in a BytesIO and rewind file objects; paths are handed to the reader as-is."""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source
+
+
+def _read_header(source: FileSource, size: int = 4) -> bytes:
+    """Read the first bytes of a file source without consuming a file object."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:size])
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return f.read(size)
+    source.seek(0)
+    header = source.read(size)
+    source.seek(0)
+    return header
+
 
 class ResumeParser:
     """
@@ -20,12 +45,12 @@ class ResumeParser:
         """Initialize the resume parser."""
         pass
     
-    def parse_pdf(self, file_content: bytes) -> Dict[str, Any]:
+    def parse_pdf(self, file_content: FileSource) -> Dict[str, Any]:
         """
         Parse a PDF file and extract text.
         
         Args:
-            file_content: PDF file content as bytes
+            file_content: PDF file content as bytes, a path or a binary file object
             
         Returns:
             Dict with extracted text and metadata
@@ -33,10 +58,14 @@ class ResumeParser:
         Raises:
             Exception: If parsing fails
         """
+        if isinstance(file_content, str):
+            # PdfReader(path) would read the whole file into a BytesIO; given an open
+            # file it seeks and reads objects as needed
+            with open(file_content, 'rb') as pdf_file:
+                return self.parse_pdf(pdf_file)
+        
         try:
-            # Create PDF reader from bytes
-            pdf_io = io.BytesIO(file_content)
-            reader = PdfReader(pdf_io)
+            reader = PdfReader(_as_stream(file_content))
             
             # Extract text from all pages
             text_parts = []
@@ -81,12 +110,12 @@ class ResumeParser:
                 'error': str(e)
             }
     
-    def parse_docx(self, file_content: bytes) -> Dict[str, Any]:
+    def parse_docx(self, file_content: FileSource) -> Dict[str, Any]:
         """
         Parse a DOCX file and extract text.
         
         Args:
-            file_content: DOCX file content as bytes
+            file_content: DOCX file content as bytes, a path or a binary file object
             
         Returns:
             Dict with extracted text and metadata
@@ -95,9 +124,8 @@ class ResumeParser:
             Exception: If parsing fails
         """
         try:
-            # Create DOCX document from bytes
-            docx_io = io.BytesIO(file_content)
-            doc = Document(docx_io)
+            # python-docx opens paths and seekable file objects as ZIP archives directly
+            doc = Document(_as_stream(file_content))
             
             # Extract text from paragraphs
             paragraphs = []
@@ -168,15 +196,18 @@ class ResumeParser:
     
     def parse_file(
         self,
-        file_content: bytes,
+        file_content: FileSource,
         filename: str,
         content_type: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Parse a resume file (PDF or DOCX) based on file extension or content type.
         
+        Passing an open file (e.g. a Django UploadedFile) or a path lets the
+        readers seek through it instead of taking a bytes copy of the whole file.
+        
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes, a path or a seekable binary file object
             filename: Original filename
             content_type: Optional MIME type
             
@@ -200,9 +231,10 @@ class ResumeParser:
             result = self.parse_docx(file_content)
         else:
             # Try to detect by content
-            if file_content.startswith(b'%PDF'):
+            header = _read_header(file_content)
+            if header.startswith(b'%PDF'):
                 result = self.parse_pdf(file_content)
-            elif file_content.startswith(b'PK'):  # DOCX is a ZIP file
+            elif header.startswith(b'PK'):  # DOCX is a ZIP file
                 result = self.parse_docx(file_content)
             else:
                 return {
@@ -0,0 +1,55 @@
+-- Migration: Add update_personal_info function
+-- Date: 2026-10-16
+-- Description: Update a resume title and upsert the owner's profile in one
+--              transaction so the personal info endpoint needs a single RPC call.
+--              Returns the resume row, or NULL if it does not exist or is not
+--              owned by p_user_id. NULL profile keys leave existing values untouched.
+
+create or replace function public.update_personal_info(
+  p_user_id uuid,
+  p_resume_id uuid,
+  p_title text,
+  p_profile jsonb
+) returns jsonb
+language plpgsql
+as $$
+declare
+  updated_resume public.resumes%rowtype;
+begin
+  if p_title is not null then
+    update public.resumes
+      set title = p_title, updated_at = now()
+      where id = p_resume_id and user_id = p_user_id
+      returning * into updated_resume;
+  else
+    select * into updated_resume
+      from public.resumes
+      where id = p_resume_id and user_id = p_user_id;
+  end if;
+
+  if not found then
+    return null;
+  end if;
+
+  if p_profile is not null and p_profile <> '{}'::jsonb then
+    insert into public.user_profiles (user_id, phone_number, location, linkedin_url, github_url, portfolio_url)
+    values (
+      p_user_id,
+      p_profile->>'phone_number',
+      p_profile->>'location',
+      p_profile->>'linkedin_url',
+      p_profile->>'github_url',
+      p_profile->>'portfolio_url'
+    )
+    on conflict (user_id) do update set
+      phone_number = coalesce(excluded.phone_number, user_profiles.phone_number),
+      location = coalesce(excluded.location, user_profiles.location),
+      linkedin_url = coalesce(excluded.linkedin_url, user_profiles.linkedin_url),
+      github_url = coalesce(excluded.github_url, user_profiles.github_url),
+      portfolio_url = coalesce(excluded.portfolio_url, user_profiles.portfolio_url),
+      updated_at = now();
+  end if;
+
+  return to_jsonb(updated_resume);
+end;
+$$;
@@ -41,6 +41,16 @@ class BaseSupabaseService:
             prepared[key] = self._serialize_value(value)
         return prepared
     
+    def _on_write(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Hook called with the rows returned by create/update/delete.
+        
+        Subclasses override this to invalidate cached data derived from the table.
+        
+        Args:
+            rows: Records written by the operation
+        """
+    
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new record.
@@ -53,6 +63,7 @@ class BaseSupabaseService:
         """
         prepared_data = self._prepare_data(data)
         response = self.client.table(self.table_name).insert(prepared_data).execute()
+        self._on_write(response.data or [])
         if response.data:
             return response.data[0]
         return {}
@@ -72,6 +83,19 @@ class BaseSupabaseService:
             return response.data[0]
         return None
     
+    def exists(self, record_id: Any) -> bool:
+        """
+        Check whether a record exists.
+        
+        Args:
+            record_id: ID of the record
+            
+        Returns:
+            bool: True if the record exists, False otherwise
+        """
+        response = self.client.table(self.table_name).select('id').eq('id', record_id).limit(1).execute()
+        return bool(response.data)
+    
     def get_all(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -146,6 +170,7 @@ class BaseSupabaseService:
         """
         prepared_data = self._prepare_data(data)
         response = self.client.table(self.table_name).update(prepared_data).eq('id', record_id).execute()
+        self._on_write(response.data or [])
         if response.data:
             return response.data[0]
         return None
@@ -161,6 +186,7 @@ class BaseSupabaseService:
             bool: True if deleted, False otherwise
         """
         response = self.client.table(self.table_name).delete().eq('id', record_id).execute()
+        self._on_write(response.data or [])
         return response.data is not None
     
     def search(
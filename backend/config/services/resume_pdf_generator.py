@@ -3,20 +3,26 @@ Premium Resume PDF Generator with WeasyPrint and Tailwind CSS.
 
 Generates stunning, professional resumes with multiple template options.
 """
+import hashlib
 import logging
 import io
+import re
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 import base64
+import requests
 
 logger = logging.getLogger(__name__)
 
 # Try to import WeasyPrint (preferred method)
 try:
-    from weasyprint import HTML, CSS
+    from weasyprint import HTML, CSS, default_url_fetcher
     from weasyprint.text.fonts import FontConfiguration
     WEASYPRINT_AVAILABLE = True
 except (ImportError, OSError) as e:
@@ -40,6 +46,255 @@ except ImportError:
     logger.warning("qrcode not available. QR codes will be skipped.")
 
 
+@lru_cache(maxsize=None)
+def get_compiled_template(template_name: str):
+    """
+    Get the compiled Django template for a resume template name.
+    
+    Templates are parsed once per process and reused for every render, so
+    exports never pay for re-lexing/re-parsing the template source.
+    """
+    return get_template(f'resumes/{template_name}.html')
+
+
+def warm_template_cache() -> None:
+    """Parse all resume templates up front (e.g. at worker boot)."""
+    for template_name in PremiumResumePDFGenerator.AVAILABLE_TEMPLATES:
+        get_compiled_template(template_name)
+
+
+# Downloaded photos are cached briefly: a photo replaced at the same storage URL shows
+# up in exports after at most this many seconds. Failed downloads are remembered for
+# a shorter time so repeated exports don't each wait for the timeout.
+_PHOTO_CACHE_TIMEOUT = 300
+_PHOTO_FAILURE_CACHE_TIMEOUT = 60
+_PHOTO_MAX_BYTES = 5 * 1024 * 1024
+
+
+def _fetch_photo(url: str) -> Tuple[str, bytes]:
+    """
+    Download a photo, checking that it is an image of at most _PHOTO_MAX_BYTES.
+    
+    Raises:
+        ValueError: If the response is not an image or is too large
+        requests.RequestException: If the download fails
+    """
+    with requests.get(url, timeout=3, stream=True) as response:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if not content_type.startswith('image/'):
+            raise ValueError(f"not an image (Content-Type {content_type or 'missing'})")
+        if int(response.headers.get('Content-Length') or 0) > _PHOTO_MAX_BYTES:
+            raise ValueError('photo too large')
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) > _PHOTO_MAX_BYTES:
+                raise ValueError('photo too large')
+    return content_type, bytes(body)
+
+
+def inline_photo_url(photo_url: str) -> Optional[str]:
+    """
+    Convert a remote photo URL into a data URI.
+    
+    WeasyPrint would otherwise perform a blocking HTTP fetch during layout on
+    every export. Data URIs are returned unchanged. If the photo cannot be
+    downloaded (or is not a reasonably sized image) None is returned, so the
+    template renders without it instead of WeasyPrint fetching it again.
+    """
+    if not photo_url.startswith(('http://', 'https://')):
+        return photo_url
+    
+    key = f"resume_photo:{hashlib.blake2b(photo_url.encode('utf-8'), digest_size=16).hexdigest()}"
+    cached = cache.get(key)
+    if cached is None:
+        try:
+            cached = _fetch_photo(photo_url)
+            cache.set(key, cached, _PHOTO_CACHE_TIMEOUT)
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Could not prefetch photo {photo_url}: {e}")
+            cached = ('', b'')
+            cache.set(key, cached, _PHOTO_FAILURE_CACHE_TIMEOUT)
+    
+    content_type, body = cached
+    if not body:
+        return None
+    return f"data:{content_type};base64,{base64.b64encode(body).decode('utf-8')}"
+
+
+# Global font configuration (singleton pattern)
+_font_config = None
+
+# Gunicorn runs threaded workers, but WeasyPrint's shared state (the Pango fontmap in
+# FontConfiguration, parsed CSS objects) is not documented as thread-safe. Renders in
+# one process therefore run one at a time; other requests still use the other threads.
+_render_lock = threading.Lock()
+# Guards creation of the lazy singletons below
+_init_lock = threading.Lock()
+
+
+def get_font_config():
+    """
+    Get the shared WeasyPrint FontConfiguration.
+    
+    Font discovery is expensive, so a single configuration is reused for
+    every export in this process instead of being rebuilt per PDF.
+    """
+    global _font_config
+    if _font_config is None:
+        with _init_lock:
+            if _font_config is None:
+                _font_config = FontConfiguration()
+    return _font_config
+
+
+@lru_cache(maxsize=64)
+def _fetch_remote_resource(url: str) -> Tuple[bytes, Optional[str], Optional[str], str]:
+    """Download a remote stylesheet resource once and keep it in memory."""
+    # Prefer a bundled copy of template web fonts (see settings.RESUME_FONTS_DIR)
+    if url.startswith('https://fonts.gstatic.com/'):
+        local_font = Path(settings.RESUME_FONTS_DIR) / url.rsplit('/', 1)[-1]
+        if local_font.is_file():
+            return local_font.read_bytes(), None, None, url
+    
+    result = default_url_fetcher(url)
+    if 'file_obj' in result:
+        with result['file_obj'] as file_obj:
+            body = file_obj.read()
+    else:
+        body = result['string']
+    return body, result.get('mime_type'), result.get('encoding'), result.get('redirected_url', url)
+
+
+def cached_url_fetcher(url: str) -> Dict[str, Any]:
+    """
+    WeasyPrint URL fetcher that caches remote resources per process.
+    
+    The templates load their web fonts from fonts.gstatic.com via @font-face, so
+    without this every PDF re-downloads the same font files. data: URLs (QR
+    codes, inlined photos) are left to the default fetcher.
+    """
+    if not url.startswith(('https://', 'http://')):
+        return default_url_fetcher(url)
+    body, mime_type, encoding, redirected_url = _fetch_remote_resource(url)
+    return {
+        'string': body,
+        'mime_type': mime_type,
+        'encoding': encoding,
+        'redirected_url': redirected_url,
+    }
+
+
+# The single <style> block each resume template carries in its <head>
+_STYLE_BLOCK_RE = re.compile(r'<style>(.*?)</style>', re.DOTALL)
+
+
+@lru_cache(maxsize=32)
+def get_compiled_stylesheet(css_text: str) -> 'CSS':
+    """
+    Get a parsed WeasyPrint stylesheet for a template's CSS.
+    
+    Parsing and compiling selectors is paid once per distinct stylesheet (per
+    template and font combination) instead of on every render.
+    """
+    return CSS(string=css_text, font_config=get_font_config(), url_fetcher=cached_url_fetcher)
+
+
+def split_stylesheet(html_content: str) -> Tuple[str, list]:
+    """
+    Pull a rendered template's <style> block out as a cached stylesheet.
+    
+    Args:
+        html_content: Rendered resume HTML
+        
+    Returns:
+        Tuple of (HTML without the style block, stylesheets to pass to write_pdf)
+    """
+    match = _STYLE_BLOCK_RE.search(html_content)
+    if not match:
+        return html_content, []
+    stylesheet = get_compiled_stylesheet(match.group(1))
+    return html_content[:match.start()] + html_content[match.end():], [stylesheet]
+
+
+@lru_cache(maxsize=4096)
+def generate_qr_code(url: str) -> str:
+    """
+    Generate a QR code for a URL as a base64 PNG data URL.
+    
+    Results are memoized per process; the profile/view URLs encoded on resumes
+    rarely change. A fixed mask pattern skips qrcode's scoring of all eight masks,
+    which dominates generation time.
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=4,
+        border=2,
+        mask_pattern=0,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+    
+    img = qr.make_image(fill_color="black", back_color="white")
+    
+    # Convert to base64
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    
+    return f"data:image/png;base64,{img_base64}"
+
+
+# write_pdf options for template previews, which are only viewed on screen and
+# rasterized to thumbnails: skip image optimization and downsample embedded images
+PREVIEW_PDF_OPTIONS = {
+    'optimize_images': False,
+    'jpeg_quality': 60,
+    'dpi': 150,
+}
+
+
+# Shared generator instance (singleton pattern); it holds no per-render state
+_pdf_generator = None
+
+
+def get_pdf_generator() -> 'PremiumResumePDFGenerator':
+    """
+    Get the process-wide PremiumResumePDFGenerator instance.
+    
+    Returns:
+        PremiumResumePDFGenerator: Shared generator
+    """
+    global _pdf_generator
+    if _pdf_generator is None:
+        with _init_lock:
+            if _pdf_generator is None:
+                _pdf_generator = PremiumResumePDFGenerator()
+    return _pdf_generator
+
+
+# Minimal resume used to exercise the full render path when warming a worker
+_WARMUP_RESUME = {'id': 'warmup', 'full_name': 'Warm Up', 'title': 'Warm Up'}
+
+
+def warm_pdf_renderer() -> None:
+    """
+    Warm template, font and WeasyPrint caches (e.g. right after a worker boots).
+    
+    Renders one throwaway PDF so cairo/pango/fontconfig initialization happens
+    before the first real export instead of during it.
+    """
+    warm_template_cache()
+    if not WEASYPRINT_AVAILABLE:
+        return
+    try:
+        get_pdf_generator().generate_pdf(_WARMUP_RESUME)
+    except Exception as e:
+        logger.warning(f"PDF renderer warmup failed: {e}")
+
+
 class PremiumResumePDFGenerator:
     """
     Generates stunning, professional resumes using WeasyPrint and Tailwind CSS.
@@ -77,6 +332,7 @@ class PremiumResumePDFGenerator:
             'body': '"Poppins", -apple-system, BlinkMacSystemFont, sans-serif',
         },
     }
+    DEFAULT_FONTS = FONT_COMBINATIONS['modern']
     
     def __init__(self):
         """Initialize the PDF generator."""
@@ -86,6 +342,19 @@ class PremiumResumePDFGenerator:
         if not WEASYPRINT_AVAILABLE:
             logger.error("WeasyPrint is required for PDF generation. Install with: pip install weasyprint")
     
+    @classmethod
+    def get_fonts(cls, font_combination: Optional[str]) -> Dict[str, str]:
+        """
+        Get the font configuration for a font combination.
+        
+        Args:
+            font_combination: Font combination name (modern, classic, creative)
+            
+        Returns:
+            Dict: Heading and body font stacks ('modern' for unknown names)
+        """
+        return cls.FONT_COMBINATIONS.get(font_combination) or cls.DEFAULT_FONTS
+    
     def generate_pdf(
         self,
         resume_data: Dict[str, Any],
@@ -93,7 +362,8 @@ class PremiumResumePDFGenerator:
         font_combination: str = 'modern',
         ats_mode: bool = False,
         photo_data: Optional[bytes] = None,
-        photo_url: Optional[str] = None
+        photo_url: Optional[str] = None,
+        preview_mode: bool = False
     ) -> Tuple[bytes, str]:
         """
         Generate a stunning PDF resume.
@@ -104,6 +374,7 @@ class PremiumResumePDFGenerator:
             font_combination: Font combination name (modern, classic, creative)
             ats_mode: If True, generate ATS-friendly version (no columns/graphics)
             photo_data: Optional photo image bytes
+            preview_mode: If True, trade embedded image quality for speed (template previews)
             
         Returns:
             Tuple of (pdf_bytes, html_preview)
@@ -117,7 +388,7 @@ class PremiumResumePDFGenerator:
             logger.warning(f"Invalid template '{template_name}', using 'modern-indigo'")
         
         # Get font configuration
-        fonts = self.FONT_COMBINATIONS.get(font_combination, self.FONT_COMBINATIONS['modern'])
+        fonts = self.get_fonts(font_combination)
         
         # Prepare template context
         context = self._prepare_context(resume_data, template_name, fonts, ats_mode, photo_data, photo_url)
@@ -128,7 +399,11 @@ class PremiumResumePDFGenerator:
         linkedin_url = resume_data.get('linkedin_url') or resume_data.get('user_profile', {}).get('linkedin_url', '')
         portfolio_url = resume_data.get('portfolio_url') or resume_data.get('user_profile', {}).get('portfolio_url', '')
         resume_id = str(resume_data.get('id', ''))
-        portfolio_view_url = f"https://resumeai.pro/view/{resume_id}" if resume_id else (portfolio_url or linkedin_url)
+        # The footer links to the public view, so skip it for drafts with no public URLs
+        if resume_id and (linkedin_url or portfolio_url or resume_data.get('status') == 'published'):
+            portfolio_view_url = f"https://resumeai.pro/view/{resume_id}"
+        else:
+            portfolio_view_url = portfolio_url or linkedin_url
         
         # Header QR code (LinkedIn or Portfolio)
         if linkedin_url or portfolio_url:
@@ -144,8 +419,7 @@ class PremiumResumePDFGenerator:
                 context['portfolio_view_url'] = portfolio_view_url
         
         # Render HTML
-        template_path = f'resumes/{template_name}.html'
-        html_content = render_to_string(template_path, context)
+        html_content = get_compiled_template(template_name).render(context)
         
         # CRITICAL DEBUG: Log what's in context
         logger.error(f"=== PDF GENERATION DEBUG ===")
@@ -163,7 +437,7 @@ class PremiumResumePDFGenerator:
         
         # Generate PDF
         try:
-            pdf_bytes = self._generate_pdf_from_html(html_content, template_name)
+            pdf_bytes = self._generate_pdf_from_html(html_content, template_name, preview_mode)
             logger.error(f"PDF generated: {len(pdf_bytes)} bytes")
             return (pdf_bytes, html_content)
         except Exception as e:
@@ -185,7 +459,7 @@ class PremiumResumePDFGenerator:
         photo_url_actual = None
         
         if photo_url:
-            photo_url_actual = photo_url
+            photo_url_actual = inline_photo_url(photo_url)
         elif photo_data:
             photo_base64 = base64.b64encode(photo_data).decode('utf-8')
         
@@ -352,29 +626,12 @@ class PremiumResumePDFGenerator:
             return None
         
         try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=4,
-                border=2,
-            )
-            qr.add_data(url)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_bytes = buffer.getvalue()
-            img_base64 = base64.b64encode(img_bytes).decode('utf-8')
-            
-            return f"data:image/png;base64,{img_base64}"
+            return generate_qr_code(url)
         except Exception as e:
             logger.warning(f"Error generating QR code: {e}")
             return None
     
-    def _generate_pdf_from_html(self, html_content: str, template_name: str) -> bytes:
+    def _generate_pdf_from_html(self, html_content: str, template_name: str, preview_mode: bool = False) -> bytes:
         """Generate PDF from HTML using WeasyPrint - NO FALLBACK."""
         if not WEASYPRINT_AVAILABLE:
             raise ImportError(
@@ -390,19 +647,27 @@ class PremiumResumePDFGenerator:
         logger.info(f"Full HTML length: {len(html_content)} chars")
         
         try:
-            # Configure fonts
-            font_config = FontConfiguration()
-            
-            # CRITICAL FIX: WeasyPrint needs base_url=None to resolve absolute URLs
-            # But we also need to ensure CSS is processed
-            # Try with None first (allows absolute URLs like https://fonts.googleapis.com)
-            html_doc = HTML(string=html_content, base_url=None)
-            
-            logger.error(f"=== WEASYPRINT GENERATION ===")
-            logger.error(f"HTML doc created, length: {len(html_content)}")
+            # Reuse the process-wide font configuration
+            font_config = get_font_config()
             
-            # Generate PDF - WeasyPrint automatically processes inline <style> tags
-            pdf_bytes = html_doc.write_pdf(stylesheets=[], font_config=font_config)
+            # WeasyPrint's shared font and CSS state is used by one render at a time
+            with _render_lock:
+                # CRITICAL FIX: WeasyPrint needs base_url=None to resolve absolute URLs
+                # But we also need to ensure CSS is processed
+                # Try with None first (allows absolute URLs like https://fonts.googleapis.com)
+                # The template's stylesheet is parsed once and reused across renders
+                html_body, stylesheets = split_stylesheet(html_content)
+                html_doc = HTML(string=html_body, base_url=None, url_fetcher=cached_url_fetcher)
+                
+                logger.error(f"=== WEASYPRINT GENERATION ===")
+                logger.error(f"HTML doc created, length: {len(html_content)}")
+                
+                # Generate PDF with the template's pre-parsed stylesheet
+                pdf_bytes = html_doc.write_pdf(
+                    stylesheets=stylesheets,
+                    font_config=font_config,
+                    **(PREVIEW_PDF_OPTIONS if preview_mode else {})
+                )
             
             logger.error(f"PDF bytes generated: {len(pdf_bytes)}")
             
@@ -486,8 +751,7 @@ class PremiumResumePDFGenerator:
         font_combination: str = 'modern'
     ) -> str:
         """Get HTML preview of the resume (for frontend preview)."""
-        fonts = self.FONT_COMBINATIONS.get(font_combination, self.FONT_COMBINATIONS['modern'])
+        fonts = self.get_fonts(font_combination)
         context = self._prepare_context(resume_data, template_name, fonts, False, None)
-        template_path = f'resumes/{template_name}.html'
-        return render_to_string(template_path, context)
+        return get_compiled_template(template_name).render(context)
 
@@ -0,0 +1,181 @@
+"""
+Helpers that turn a stored resume into PDF template context.
+
+Kept free of Django/DRF imports and fully annotated so the module can be
+compiled with mypyc (``mypyc config/services/resume_render_helpers.py``).
+A compiled extension next to this file takes precedence on import; without
+one the plain Python module is used.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Contact fields that may come from personal_info or the resume itself
+CONTACT_FIELDS = ('email', 'phone', 'location', 'linkedin_url', 'github_url', 'portfolio_url')
+PERSONAL_INFO_FIELDS = ('full_name',) + CONTACT_FIELDS
+
+# Section lists passed to the PDF templates
+RESUME_SECTIONS = (
+    'experiences', 'educations', 'skills', 'projects', 'certifications', 'languages', 'interests',
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeRenderData:
+    """
+    Resume fields passed to the PDF generator, coalesced once from a detailed resume.
+    
+    Supports ``get()`` and ``[]`` so code written against the previous dict
+    (PremiumResumePDFGenerator, the reportlab fallback) keeps working.
+    """
+    id: str
+    full_name: str
+    title: str
+    status: str
+    professional_tagline: str
+    summary: str
+    optimized_summary: str
+    email: str
+    phone: str
+    location: str
+    linkedin_url: str
+    github_url: str
+    portfolio_url: str
+    personal_info: Dict[str, Any]
+    experiences: List[Dict[str, Any]]
+    educations: List[Dict[str, Any]]
+    skills: List[Dict[str, Any]]
+    projects: List[Dict[str, Any]]
+    certifications: List[Dict[str, Any]]
+    languages: List[Dict[str, Any]]
+    interests: List[Dict[str, Any]]
+    
+    @classmethod
+    def from_resume(cls, resume: Dict[str, Any]) -> 'ResumeRenderData':
+        """
+        Build render data from a resume with all related data.
+        
+        Args:
+            resume: Resume with all related data (see ResumeService.get_resume_with_details)
+            
+        Returns:
+            ResumeRenderData: Coalesced render data
+        """
+        # Bind the lookups once; they run ~30 times below
+        r = resume.get
+        
+        # Extract personal_info if it's stored as a JSON field
+        personal_info = r('personal_info')
+        if not isinstance(personal_info, dict):
+            # If personal_info is stored as separate fields, construct it
+            personal_info = {field: r(field, '') for field in PERSONAL_INFO_FIELDS}
+        pi = personal_info.get
+        
+        # COMPLETE resume data for PDF generation - NO DATA STRIPPING
+        return cls(
+            id=str(r('id', '')),
+            full_name=pi('full_name') or r('title', '') or r('full_name', 'Your Name'),
+            title=r('title', ''),  # This is the name field in DB
+            status=r('status', ''),
+            professional_tagline=r('professional_tagline', ''),
+            summary=r('summary', ''),
+            optimized_summary=r('optimized_summary', ''),
+            # Non-empty personal_info values win over the resume's own columns
+            **{field: pi(field) or r(field, '') for field in CONTACT_FIELDS},
+            personal_info=personal_info,
+            # Pass ALL data - ensure lists are never None
+            **{section: r(section) or [] for section in RESUME_SECTIONS},
+        )
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access with a default for unknown keys."""
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+def build_resume_data(resume: Dict[str, Any]) -> ResumeRenderData:
+    """
+    Build the render data for PDF generation from a detailed resume.
+    
+    Args:
+        resume: Resume with all related data (see ResumeService.get_resume_with_details)
+        
+    Returns:
+        ResumeRenderData: Resume data for PremiumResumePDFGenerator
+    """
+    resume_data = ResumeRenderData.from_resume(resume)
+    
+    # Log final data being sent to generator
+    logger.info(
+        f"Resume data prepared for PDF - "
+        f"full_name: '{resume_data.full_name}', "
+        f"title: '{resume_data.title}', "
+        f"professional_tagline: '{resume_data.professional_tagline}', "
+        f"experiences: {len(resume_data.experiences)}, "
+        f"projects: {len(resume_data.projects)}, "
+        f"skills: {len(resume_data.skills)}, "
+        f"educations: {len(resume_data.educations)}, "
+        f"certifications: {len(resume_data.certifications)}"
+    )
+    
+    return resume_data
+
+
+def build_render_context(
+    generator: Any,
+    resume_data: ResumeRenderData,
+    template_name: str,
+    font_combination: str,
+    ats_mode: bool,
+    photo_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the full template context, including QR codes, for a resume.
+    
+    Mirrors what PremiumResumePDFGenerator.generate_pdf renders, so the HTML
+    matches what is sent to WeasyPrint.
+    
+    Args:
+        generator: PremiumResumePDFGenerator instance
+        resume_data: Render data for the resume
+        template_name: Template ID
+        font_combination: Font combination key
+        ats_mode: Whether to render the ATS-friendly variant
+        photo_url: Optional profile photo URL
+        
+    Returns:
+        Dict: Template context
+    """
+    fonts = generator.get_fonts(font_combination)
+    context: Dict[str, Any] = generator._prepare_context(resume_data, template_name, fonts, ats_mode, None, photo_url)
+    
+    # Header and footer QR codes (generate_qr_code memoizes them per URL)
+    linkedin_url = resume_data.linkedin_url
+    portfolio_url = resume_data.portfolio_url
+    header_url = linkedin_url or portfolio_url
+    resume_id = resume_data.id
+    # The footer links to the public view, so skip it for drafts with no public URLs
+    if resume_id and (header_url or resume_data.status == 'published'):
+        portfolio_view_url = f"https://resumeai.pro/view/{resume_id}"
+    else:
+        portfolio_view_url = portfolio_url or linkedin_url
+    
+    if header_url:
+        qr_code_data = generator._generate_qr_code(header_url)
+        if qr_code_data:
+            context['qr_code'] = qr_code_data
+    
+    if portfolio_view_url:
+        qr_code_footer_data = generator._generate_qr_code(portfolio_view_url)
+        if qr_code_footer_data:
+            context['qr_code_footer'] = qr_code_footer_data
+            context['portfolio_view_url'] = portfolio_view_url
+    
+    return context
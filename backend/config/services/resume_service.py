@@ -3,16 +3,70 @@ Service for resume-related Supabase operations.
 """
 import logging
 from typing import Dict, List, Optional, Any
+from django.conf import settings
+from django.core.cache import cache
+from supabase import Client
 from config.services.base import BaseSupabaseService
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by the resume list endpoint (matches ResumeListSerializer)
+RESUME_LIST_COLUMNS = (
+    'id,title,professional_tagline:summary,status,last_template,last_font,created_at,updated_at'
+)
 
-class ResumeService(BaseSupabaseService):
-    """Service for managing resumes in Supabase."""
+# Embedded resume sections and their orderings (mirrors each section service's get_by_resume_id)
+RESUME_SECTION_ORDERING = (
+    ('experiences', 'order.asc,start_date.desc'),
+    ('educations', 'order.asc,start_date.desc'),
+    ('skills', 'order.asc'),
+    ('projects', 'order.asc,start_date.desc'),
+    ('certifications', 'order.asc,issue_date.desc'),
+    ('languages', 'order.asc'),
+    ('interests', 'order.asc'),
+)
+RESUME_BUNDLE_COLUMNS = '*,' + ','.join(f'{table}(*)' for table, _ in RESUME_SECTION_ORDERING)
+
+
+def _resume_detail_cache_key(resume_id: Any) -> str:
+    """Cache key for an assembled resume (see ResumeService.get_resume_with_details)."""
+    return f'resume_detail:{resume_id}'
+
+
+def invalidate_resume_detail(resume_id: Any) -> None:
+    """
+    Drop the cached resume details for a resume.
     
-    def __init__(self):
-        super().__init__('resumes')
+    Args:
+        resume_id: Resume ID
+    """
+    if resume_id and settings.RESUME_DETAIL_CACHE_TIMEOUT:
+        cache.delete(_resume_detail_cache_key(resume_id))
+
+
+class ResumeDetailCacheMixin:
+    """Invalidates the cached resume details when a resume or one of its sections is written."""
+    
+    # Column holding the resume ID on rows of this table
+    resume_id_field = 'resume_id'
+    
+    def _on_write(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            invalidate_resume_detail(row.get(self.resume_id_field))
+
+
+class ResumeService(ResumeDetailCacheMixin, BaseSupabaseService):
+    """
+    Service for managing resumes in Supabase.
+    
+    Rows come back from PostgREST as JSON, so ``user_id`` is always a ``str`` and
+    can be compared directly against the Supabase user ID from the request.
+    """
+    
+    resume_id_field = 'id'
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__('resumes', client)
     
     def get_user_resumes(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -29,16 +83,178 @@ class ResumeService(BaseSupabaseService):
             order_by='updated_at.desc'
         )
     
+    def get_user_resume_list(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the resume list rows for a user, shaped like ResumeListSerializer output.
+        
+        Selects only the listed columns (``summary`` aliased to
+        ``professional_tagline``), so rows can be rendered to JSON as-is.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            List: List of resume summaries
+        """
+        response = (
+            self.client.table(self.table_name)
+            .select(RESUME_LIST_COLUMNS)
+            .eq('user_id', user_id)
+            .order('updated_at', desc=True)
+            .execute()
+        )
+        return response.data or []
+    
+    def update_if_owned(
+        self,
+        resume_id: str,
+        user_id: str,
+        data: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a resume only if it belongs to the given user.
+        
+        Ownership check and write happen in a single conditional UPDATE
+        (``WHERE id = ... AND user_id = ...``), so there is no separate fetch.
+        
+        Args:
+            resume_id: Resume ID
+            user_id: Supabase user ID expected to own the resume
+            data: Dictionary of data to update
+            expected: Optional column values the row must still have for the write to apply
+            
+        Returns:
+            Dict: Updated resume, or None if it does not exist, is not owned by the
+            user or no longer matches ``expected``
+        """
+        prepared_data = self._prepare_data(data)
+        query = (
+            self.client.table(self.table_name)
+            .update(prepared_data)
+            .eq('id', resume_id)
+            .eq('user_id', user_id)
+        )
+        for column, value in (expected or {}).items():
+            query = query.is_(column, 'null') if value is None else query.eq(column, value)
+        response = query.execute()
+        self._on_write(response.data or [])
+        if response.data:
+            return response.data[0]
+        return None
+
+    def update_personal_info_atomic(
+        self,
+        resume_id: str,
+        user_id: str,
+        title: Optional[str],
+        profile_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update the resume title and upsert the user's profile in one round trip.
+
+        Calls the ``update_personal_info`` Postgres function (migration 013), which
+        performs both writes in a single transaction. Falls back to separate
+        requests if the function has not been created yet.
+
+        Args:
+            resume_id: Resume ID
+            user_id: Supabase user ID expected to own the resume
+            title: New resume title, or None to leave it unchanged
+            profile_data: Profile columns to set (only non-empty values)
+
+        Returns:
+            Dict: Resume, or None if it does not exist or is not owned by the user
+        """
+        try:
+            response = self.client.rpc('update_personal_info', {
+                'p_user_id': user_id,
+                'p_resume_id': resume_id,
+                'p_title': title,
+                'p_profile': profile_data,
+            }).execute()
+            invalidate_resume_detail(resume_id)
+            return response.data or None
+        except Exception as e:
+            error_str = str(e)
+            if 'PGRST202' not in error_str and 'Could not find the function' not in error_str:
+                raise
+            logger.warning(
+                "update_personal_info function not found, falling back to separate updates. "
+                "Run migration 013_update_personal_info_function.sql"
+            )
+
+        if title is not None:
+            resume = self.update_if_owned(resume_id, user_id, {'title': title})
+        else:
+            resume = self.get_by_id(resume_id)
+            if resume and resume.get('user_id') != user_id:
+                resume = None
+
+        if resume and profile_data:
+            from config.services.user_service import UserProfileService
+            UserProfileService().create_or_update_profile(user_id=user_id, **profile_data)
+
+        return resume
+
     def get_resume_with_details(self, resume_id: str) -> Optional[Dict[str, Any]]:
         """
         Get resume with all related data (experiences, educations, skills, etc.).
         
+        The assembled result is cached for RESUME_DETAIL_CACHE_TIMEOUT seconds and
+        invalidated whenever the resume or one of its sections is written.
+        
         Args:
             resume_id: Resume ID
             
         Returns:
             Dict: Resume with all related data or None if not found
         """
+        timeout = settings.RESUME_DETAIL_CACHE_TIMEOUT
+        if not timeout:
+            return self._load_resume_with_details(resume_id)
+        
+        key = _resume_detail_cache_key(resume_id)
+        resume = cache.get(key)
+        if resume is None:
+            resume = self._load_resume_with_details(resume_id)
+            if resume:
+                cache.set(key, resume, timeout)
+        return resume
+    
+    def get_resume_bundle(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a resume and all of its sections in a single request.
+        
+        Uses PostgREST resource embedding, so the sections come back nested in
+        the resume row instead of needing one query per table.
+        
+        Args:
+            resume_id: Resume ID
+            
+        Returns:
+            Dict: Resume with all related data or None if not found
+        """
+        query = self.client.table(self.table_name).select(RESUME_BUNDLE_COLUMNS).eq('id', resume_id)
+        for table, order_by in RESUME_SECTION_ORDERING:
+            for order_part in order_by.split(','):
+                col, direction = order_part.rsplit('.', 1)
+                query = query.order(col, desc=direction == 'desc', foreign_table=table)
+        response = query.limit(1).execute()
+        if response.data:
+            return response.data[0]
+        return None
+    
+    def _load_resume_with_details(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a resume and all of its sections from Supabase."""
+        try:
+            return self.get_resume_bundle(resume_id)
+        except Exception as e:
+            # PGRST200: a section table (e.g. languages/interests) is missing, so it cannot be embedded
+            if 'PGRST200' not in str(e) and 'Could not find a relationship' not in str(e):
+                raise
+            logger.warning(f"Could not embed resume sections, fetching them separately: {e}")
+        
         resume = self.get_by_id(resume_id)
         if not resume:
             return None
@@ -94,7 +310,7 @@ class ResumeService(BaseSupabaseService):
 
 
 # Related service classes for resume sections
-class EducationService(BaseSupabaseService):
+class EducationService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing educations."""
     
     def __init__(self):
@@ -108,7 +324,7 @@ class EducationService(BaseSupabaseService):
         )
 
 
-class ExperienceService(BaseSupabaseService):
+class ExperienceService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing experiences."""
     
     def __init__(self):
@@ -122,7 +338,7 @@ class ExperienceService(BaseSupabaseService):
         )
 
 
-class SkillService(BaseSupabaseService):
+class SkillService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing skills."""
     
     def __init__(self):
@@ -136,7 +352,7 @@ class SkillService(BaseSupabaseService):
         )
 
 
-class ProjectService(BaseSupabaseService):
+class ProjectService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing projects."""
     
     def __init__(self):
@@ -150,7 +366,7 @@ class ProjectService(BaseSupabaseService):
         )
 
 
-class CertificationService(BaseSupabaseService):
+class CertificationService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing certifications."""
     
     def __init__(self):
@@ -164,7 +380,7 @@ class CertificationService(BaseSupabaseService):
         )
 
 
-class LanguageService(BaseSupabaseService):
+class LanguageService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing languages."""
     
     def __init__(self):
@@ -178,7 +394,7 @@ class LanguageService(BaseSupabaseService):
         )
 
 
-class InterestService(BaseSupabaseService):
+class InterestService(ResumeDetailCacheMixin, BaseSupabaseService):
     """Service for managing interests."""
     
     def __init__(self):
@@ -83,6 +83,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.ClientIPMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -163,6 +164,18 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Offload serving of media files to the front web server when it supports it.
+# 'X-Accel-Redirect' (nginx) needs an internal location aliased to MEDIA_ROOT, e.g.
+#   location /internal-media/ { internal; alias /path/to/backend/media/; }
+# 'X-Sendfile' (Apache mod_xsendfile) takes the absolute file path.
+SENDFILE_HEADER = os.getenv('SENDFILE_HEADER', '')
+SENDFILE_URL_PREFIX = os.getenv('SENDFILE_URL_PREFIX', '/internal-media/')
+
+# Local copies of the web fonts the resume templates load from fonts.gstatic.com.
+# A file named like the last segment of a font URL is used instead of downloading it,
+# so PDF rendering needs no network access for fonts.
+RESUME_FONTS_DIR = Path(os.getenv('RESUME_FONTS_DIR', BASE_DIR / 'static' / 'fonts'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -230,6 +243,8 @@ SPECTACULAR_SETTINGS = {
 SUPABASE_URL = os.getenv('SUPABASE_URL', '')
 SUPABASE_ANON_KEY = os.getenv('SUPABASE_ANON_KEY', '')
 SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY', '')
+# Run resume queries with the caller's JWT so Row Level Security policies apply
+SUPABASE_RLS_ENFORCED = os.getenv('SUPABASE_RLS_ENFORCED', 'false').lower() == 'true'
 
 # OpenAI configuration
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -241,6 +256,37 @@ PINECONE_ENV = os.getenv('PINECONE_ENV', '')
 # Redis configuration
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 
+# Cache configuration (shared Redis cache when CACHE_URL is set, per-process memory otherwise)
+CACHE_URL = os.getenv('CACHE_URL', '')
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds to cache assembled resume details (0 disables). Only enabled by default with a
+# shared cache, since invalidation must reach every worker.
+RESUME_DETAIL_CACHE_TIMEOUT = int(os.getenv('RESUME_DETAIL_CACHE_TIMEOUT', '300' if CACHE_URL else '0'))
+
+# Seconds to cache AI endpoint responses for identical input (0 disables). Keys hash the
+# input and resume content, so no invalidation is needed and a per-worker cache is fine.
+AI_RESPONSE_CACHE_TIMEOUT = int(os.getenv('AI_RESPONSE_CACHE_TIMEOUT', '3600'))
+
+# Hash for guest AI throttle fingerprints: 'blake2b' (keyed BLAKE2b) or 'hmac' (the previous
+# salted_hmac scheme). Switching starts every guest on a fresh counter key.
+GUEST_FINGERPRINT_HASH = os.getenv('GUEST_FINGERPRINT_HASH', 'blake2b')
+# Up to this many seconds are randomly added to each guest throttle window, so counters created
+# in a burst do not all expire at the same moment (0 disables)
+GUEST_THROTTLE_TTL_JITTER = int(os.getenv('GUEST_THROTTLE_TTL_JITTER', '60'))
+
 # Celery configuration
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', REDIS_URL)
 CELERY_RESULT_BACKEND = REDIS_URL
@@ -248,6 +294,15 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Resume parsing runs on dedicated workers: celery -A config worker -Q parsing
+CELERY_TASK_ROUTES = {
+    'api.tasks.ai.parse_resume_task': {'queue': 'parsing'},
+}
+
+# Parse uploaded resume files on Celery workers: parse-resume-file answers 202 with a task_id
+# to poll at /api/v1/ai/task-status/<task_id>/ instead of the parsed text. Each task's submitter is
+# recorded in the default cache, so with several web workers this needs the shared cache (CACHE_URL).
+RESUME_PARSE_ASYNC = os.getenv('RESUME_PARSE_ASYNC', 'false').lower() == 'true'
 
 # Sentry configuration
 SENTRY_DSN = os.getenv('SENTRY_DSN', '')
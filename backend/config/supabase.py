@@ -2,6 +2,7 @@
 Supabase client initialization and configuration.
 """
 import os
+from postgrest import SyncPostgrestClient
 from supabase import create_client, Client
 from django.conf import settings
 
@@ -43,6 +44,38 @@ def get_supabase_anon_client() -> Client:
     return create_client(url, key)
 
 
+def get_supabase_user_client(access_token: str) -> SyncPostgrestClient:
+    """
+    Create a PostgREST client that acts as the given user.
+    
+    Requests carry the user's JWT with the anon key, so Row Level Security
+    policies apply and ``auth.uid()`` resolves to the user. The client is
+    meant for one request: the caller closes its session (``client.session``)
+    when done, so neither its connections nor the token outlive the request.
+    
+    Args:
+        access_token: Supabase access token (JWT) of the user
+        
+    Returns:
+        SyncPostgrestClient: Client exposing ``table()`` and ``rpc()``
+    """
+    url = settings.SUPABASE_URL
+    key = settings.SUPABASE_ANON_KEY
+    
+    if not url or not key:
+        raise ValueError(
+            "Supabase URL and ANON_KEY must be set in environment variables."
+        )
+    
+    return SyncPostgrestClient(
+        f"{url}/rest/v1",
+        headers={
+            'apikey': key,
+            'Authorization': f'Bearer {access_token}',
+        },
+    )
+
+
 # Global client instance (singleton pattern)
 _supabase_client: Client = None
 
@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration.
+
+Picked up automatically when running ``gunicorn config.wsgi:application``
+from the backend directory.
+"""
+import os
+
+# Threaded workers: a request blocked on Supabase or OpenAI no longer holds the whole worker.
+# WeasyPrint renders within a worker are serialized (see resume_pdf_generator._render_lock).
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+# Serve FileResponse bodies (template previews/thumbnails) via wsgi.file_wrapper + sendfile(2)
+sendfile = True
+
+
+def post_worker_init(worker):
+    """Warm the PDF renderer so the first export in a fresh worker is not a cold start."""
+    from config.services.resume_pdf_generator import warm_pdf_renderer
+    warm_pdf_renderer()